@@ -21,14 +21,31 @@ Enable by configuring webhook URLs in .env or via the API.
 import os
 import logging
 import asyncio
+import time
+import random
+from functools import wraps
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import json
+from itertools import islice
 
 import httpx
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -47,6 +64,34 @@ GENERIC_WEBHOOK_HEADERS = os.environ.get("GENERIC_WEBHOOK_HEADERS", "")  # JSON
 # Alert throttling (prevent spam)
 ALERT_COOLDOWN_SECONDS = int(os.environ.get("ALERT_COOLDOWN_SECONDS", "60"))
 
+# Maximum number of throttle keys tracked (oldest evicted first)
+ALERT_THROTTLE_MAX_KEYS = int(os.environ.get("ALERT_THROTTLE_MAX_KEYS", "10000"))
+
+# Push gating: alerts scoring below the threshold are not sent unless HIGH/CRITICAL,
+# and at most ALERT_PUSH_RATE_LIMIT alerts are pushed per minute. At the default
+# threshold every alert passes while it is less than half a cooldown old; only
+# low-value alerts that sat in the queue past that are dropped
+ALERT_PUSH_THRESHOLD = float(os.environ.get("ALERT_PUSH_THRESHOLD", "0.3"))
+ALERT_PUSH_RATE_LIMIT = int(os.environ.get("ALERT_PUSH_RATE_LIMIT", "60"))
+
+# Background alert queue (producers enqueue, a worker dispatches each alert
+# with at most ALERT_MAX_IN_FLIGHT deliveries running at once)
+ALERT_QUEUE_SIZE = int(os.environ.get("ALERT_QUEUE_SIZE", "10000"))
+ALERT_MAX_IN_FLIGHT = 32
+ALERT_CLOSE_DRAIN_SECONDS = 20.0  # How long close() waits for queued alerts
+
+# Webhook delivery retries (429/5xx/network errors) with exponential backoff
+WEBHOOK_MAX_ATTEMPTS = int(os.environ.get("WEBHOOK_MAX_ATTEMPTS", "3"))
+WEBHOOK_RETRY_BUDGET_SECONDS = 15.0  # Give up once retries would exceed this
+
+# Webhook HTTP client tuning (one client per webhook, connections reused across alerts)
+WEBHOOK_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+WEBHOOK_LIMITS = httpx.Limits(
+    max_connections=16,
+    max_keepalive_connections=8,
+    keepalive_expiry=30.0,
+)
+
 # =============================================================================
 # Alert Types
 # =============================================================================
@@ -73,15 +118,20 @@ class AlertSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Alert:
-    """Represents an alert to be sent."""
+    """Represents an alert to be sent (immutable once created)."""
     alert_type: AlertType
     severity: AlertSeverity
     title: str
     message: str
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_epoch: float = field(default_factory=time.time)  # seconds since epoch (UTC)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Alert time as a naive UTC datetime."""
+        return datetime.utcfromtimestamp(self.timestamp_epoch)
 
     def to_dict(self) -> dict:
         """Convert alert to dictionary."""
@@ -95,6 +145,156 @@ class Alert:
         }
 
 
+# Throttle keys are small tuples, e.g. (AlertType.NEW_DRONE, "drone-001")
+ThrottleKey = Tuple[Any, Any]
+
+
+@dataclass(slots=True)
+class _ThrottleEntry:
+    """Throttle bookkeeping for one alert key."""
+    last_sent: float  # time.monotonic()
+    suppressed: int = 0  # alerts dropped since last_sent
+    last_alert: Optional[Alert] = None  # most recent suppressed alert
+
+
+def _drone_key(alert: Alert) -> ThrottleKey:
+    return (alert.alert_type, alert.details.get("drone_id"))
+
+
+def _kit_key(alert: Alert) -> ThrottleKey:
+    # Offline and online share a key so a flapping kit is throttled as one
+    return ("kit_status", alert.details.get("kit_id"))
+
+
+def _default_key(alert: Alert) -> ThrottleKey:
+    return (alert.alert_type, alert.severity)
+
+
+# Webhook formatting lookup tables (built once, not per alert)
+_SLACK_EMOJI = {
+    AlertSeverity.INFO: ":information_source:",
+    AlertSeverity.WARNING: ":warning:",
+    AlertSeverity.HIGH: ":rotating_light:",
+    AlertSeverity.CRITICAL: ":fire:",
+}
+
+_SLACK_COLOR = {
+    AlertSeverity.INFO: "#36a64f",
+    AlertSeverity.WARNING: "#ffcc00",
+    AlertSeverity.HIGH: "#ff6600",
+    AlertSeverity.CRITICAL: "#ff0000",
+}
+
+_SLACK_MAX_FIELDS = 10
+_DISCORD_MAX_FIELDS = 25  # Discord limit
+
+_DISCORD_COLOR = {
+    AlertSeverity.INFO: 0x36a64f,
+    AlertSeverity.WARNING: 0xffcc00,
+    AlertSeverity.HIGH: 0xff6600,
+    AlertSeverity.CRITICAL: 0xff0000,
+}
+
+
+def _slack_skeleton(emoji: str, color: str) -> dict:
+    return {
+        "color": color,
+        "emoji": emoji,
+        "pretext": f"{emoji} *WarDragon Alert*",
+        "footer": "WarDragon Analytics",
+    }
+
+
+# Per-severity static payload parts, so formatting is one lookup + fill-in
+_SLACK_SKELETON = {
+    sev: _slack_skeleton(_SLACK_EMOJI[sev], _SLACK_COLOR[sev]) for sev in AlertSeverity
+}
+_SLACK_SKELETON_DEFAULT = _slack_skeleton(":bell:", "#808080")
+
+_DISCORD_SKELETON = {
+    sev: {"color": _DISCORD_COLOR[sev], "footer": {"text": "WarDragon Analytics"}}
+    for sev in AlertSeverity
+}
+_DISCORD_SKELETON_DEFAULT = {"color": 0x808080, "footer": {"text": "WarDragon Analytics"}}
+
+# Push score weights and per-type urgency (see AlertManager._should_push)
+_W_SEVERITY = 0.4
+_W_URGENCY = 0.2
+_W_FRESHNESS = 0.4
+
+_SEVERITY_SCORE = {
+    AlertSeverity.INFO: 0.1,
+    AlertSeverity.WARNING: 0.4,
+    AlertSeverity.HIGH: 0.8,
+    AlertSeverity.CRITICAL: 1.0,
+}
+
+_HIGH_IMPACT = frozenset({AlertSeverity.HIGH, AlertSeverity.CRITICAL})
+
+_URGENCY_SCORE = {
+    AlertType.WATCHLIST_MATCH: 1.0,
+    AlertType.SECURITY_ALERT: 0.8,
+    AlertType.RAPID_DESCENT: 0.8,
+    AlertType.KIT_OFFLINE: 0.7,
+    AlertType.ANOMALY: 0.6,
+    AlertType.FPV_SIGNAL: 0.6,
+    AlertType.NEW_DRONE: 0.5,
+    AlertType.NIGHT_ACTIVITY: 0.5,
+    AlertType.LOITERING: 0.5,
+    AlertType.KIT_ONLINE: 0.3,
+}
+
+
+def _detail_items(details: Dict[str, Any], limit: int):
+    """Yield (label, value) for up to `limit` non-null detail entries."""
+    present = ((k, v) for k, v in details.items() if v is not None)
+    for key, value in islice(present, limit):
+        yield key.replace("_", " ").title(), str(value)
+
+
+def _parse_headers(raw: str) -> Dict[str, str]:
+    """Parse a JSON object of extra HTTP headers, returning {} if invalid."""
+    if not raw:
+        return {}
+    try:
+        headers = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except ValueError:
+        logger.warning("Failed to parse GENERIC_WEBHOOK_HEADERS as JSON")
+        return {}
+    if not isinstance(headers, dict):
+        logger.warning("GENERIC_WEBHOOK_HEADERS must be a JSON object, ignoring")
+        return {}
+    return {str(k): str(v) for k, v in headers.items()}
+
+
+# Validated once at import rather than per webhook registration
+_GENERIC_HEADERS = _parse_headers(GENERIC_WEBHOOK_HEADERS)
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    """Seconds to wait from a Retry-After header, or default if absent/unparseable."""
+    try:
+        return max(float(response.headers.get("Retry-After", default)), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+def _dumps(payload: dict) -> bytes:
+    """Serialize a webhook payload to JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
+
+# Throttle key builders per alert type (similar alerts are grouped together)
+_THROTTLE_KEY_BUILDERS: Dict[AlertType, Callable[[Alert], ThrottleKey]] = {
+    AlertType.NEW_DRONE: _drone_key,
+    AlertType.WATCHLIST_MATCH: _drone_key,
+    AlertType.KIT_OFFLINE: _kit_key,
+    AlertType.KIT_ONLINE: _kit_key,
+}
+
+
 # =============================================================================
 # Alert Manager
 # =============================================================================
@@ -102,20 +302,35 @@ class Alert:
 class AlertManager:
     """
     Manages alert sending and throttling.
-    Thread-safe for concurrent access.
+    Safe for concurrent use from multiple coroutines.
     """
 
     def __init__(self):
-        self._last_alerts: Dict[str, datetime] = {}  # key -> last_sent_time
+        # key -> throttle entry, least recently used first
+        self._last_alerts: "OrderedDict[ThrottleKey, _ThrottleEntry]" = OrderedDict()
+        self._throttle_cap = ALERT_THROTTLE_MAX_KEYS
+        self._last_purge = time.monotonic()
+        self._throttle_lock = asyncio.Lock()
+        self._push_times: "deque[float]" = deque()  # time.monotonic() of recent pushes
         self._webhooks: List[Dict[str, Any]] = []
         self._load_webhooks_from_env()
         self._enabled = ALERTING_ENABLED
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self._queue: "asyncio.Queue[Alert]" = asyncio.Queue(maxsize=ALERT_QUEUE_SIZE)
+        self._worker_task: Optional[asyncio.Task] = None
+        self._in_flight: "set[asyncio.Task]" = set()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AlertManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     def _load_webhooks_from_env(self):
         """Load webhook configurations from environment."""
         if SLACK_WEBHOOK_URL:
-            self._webhooks.append({
+            self._register_webhook({
                 "type": "slack",
                 "url": SLACK_WEBHOOK_URL,
                 "name": "Slack",
@@ -123,7 +338,7 @@ class AlertManager:
             logger.info("Loaded Slack webhook configuration")
 
         if DISCORD_WEBHOOK_URL:
-            self._webhooks.append({
+            self._register_webhook({
                 "type": "discord",
                 "url": DISCORD_WEBHOOK_URL,
                 "name": "Discord",
@@ -131,26 +346,34 @@ class AlertManager:
             logger.info("Loaded Discord webhook configuration")
 
         if GENERIC_WEBHOOK_URL:
-            headers = {}
-            if GENERIC_WEBHOOK_HEADERS:
-                try:
-                    headers = json.loads(GENERIC_WEBHOOK_HEADERS)
-                except json.JSONDecodeError:
-                    logger.warning("Failed to parse GENERIC_WEBHOOK_HEADERS as JSON")
-
-            self._webhooks.append({
+            self._register_webhook({
                 "type": "generic",
                 "url": GENERIC_WEBHOOK_URL,
                 "name": "Generic Webhook",
-                "headers": headers,
+                "headers": _GENERIC_HEADERS,
             })
             logger.info("Loaded generic webhook configuration")
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=10.0)
-        return self._http_client
+    def _register_webhook(self, webhook: Dict[str, Any]):
+        """Add a webhook entry; its HTTP client is created on first use."""
+        webhook["client"] = None
+        webhook["request_headers"] = {
+            "Content-Type": "application/json",
+            **(webhook.get("headers") or {}),
+        }
+        self._webhooks.append(webhook)
+
+    async def _get_client_for(self, webhook: Dict[str, Any]) -> httpx.AsyncClient:
+        """Get or create the webhook's dedicated HTTP client (HTTP/2 when available)."""
+        if webhook["client"] is None:
+            async with self._client_lock:
+                if webhook["client"] is None:
+                    webhook["client"] = httpx.AsyncClient(
+                        http2=HTTP2_AVAILABLE,
+                        timeout=WEBHOOK_TIMEOUT,
+                        limits=WEBHOOK_LIMITS,
+                    )
+        return webhook["client"]
 
     def is_enabled(self) -> bool:
         """Check if alerting is enabled."""
@@ -163,6 +386,8 @@ class AlertManager:
             "webhooks_configured": len(self._webhooks),
             "webhook_types": [w["type"] for w in self._webhooks],
             "cooldown_seconds": ALERT_COOLDOWN_SECONDS,
+            "push_threshold": ALERT_PUSH_THRESHOLD,
+            "push_rate_limit_per_min": ALERT_PUSH_RATE_LIMIT,
         }
 
     def add_webhook(self, webhook_type: str, url: str, name: str = "", headers: dict = None):
@@ -173,14 +398,20 @@ class AlertManager:
             "name": name or webhook_type,
             "headers": headers or {},
         }
-        self._webhooks.append(webhook)
+        self._register_webhook(webhook)
         logger.info(f"Added {webhook_type} webhook: {name}")
 
     def remove_webhook(self, url: str) -> bool:
         """Remove a webhook by URL."""
-        initial_count = len(self._webhooks)
+        removed = [w for w in self._webhooks if w["url"] == url]
         self._webhooks = [w for w in self._webhooks if w["url"] != url]
-        return len(self._webhooks) < initial_count
+        for webhook in removed:
+            if webhook["client"] is not None:
+                try:
+                    asyncio.get_running_loop().create_task(webhook["client"].aclose())
+                except RuntimeError:
+                    pass  # No running loop; client is released on garbage collection
+        return len(removed) > 0
 
     def list_webhooks(self) -> List[dict]:
         """List configured webhooks (URLs masked for security)."""
@@ -193,104 +424,186 @@ class AlertManager:
             for w in self._webhooks
         ]
 
-    def _get_throttle_key(self, alert: Alert) -> str:
+    def _get_throttle_key(self, alert: Alert) -> ThrottleKey:
         """Generate a throttle key for an alert."""
-        # Group similar alerts together for throttling
-        if alert.alert_type == AlertType.NEW_DRONE:
-            return f"new_drone:{alert.details.get('drone_id', 'unknown')}"
-        elif alert.alert_type == AlertType.WATCHLIST_MATCH:
-            return f"watchlist:{alert.details.get('drone_id', 'unknown')}"
-        elif alert.alert_type in (AlertType.KIT_OFFLINE, AlertType.KIT_ONLINE):
-            return f"kit_status:{alert.details.get('kit_id', 'unknown')}"
-        else:
-            return f"{alert.alert_type.value}:{alert.severity.value}"
-
-    def _is_throttled(self, alert: Alert) -> bool:
-        """Check if an alert should be throttled."""
+        return _THROTTLE_KEY_BUILDERS.get(alert.alert_type, _default_key)(alert)
+
+    async def _is_throttled(self, alert: Alert) -> bool:
+        """
+        Check if an alert should be held back: within its key's cooldown, or
+        not worth a push (see _should_push). Only alerts that will be sent
+        start the key's cooldown.
+        """
         key = self._get_throttle_key(alert)
-        now = datetime.utcnow()
 
-        if key in self._last_alerts:
-            elapsed = (now - self._last_alerts[key]).total_seconds()
-            if elapsed < ALERT_COOLDOWN_SECONDS:
+        async with self._throttle_lock:
+            now = time.monotonic()
+
+            if now - self._last_purge >= ALERT_COOLDOWN_SECONDS:
+                self._purge_expired(now)
+
+            entry = self._last_alerts.get(key)
+            if entry is not None and now - entry.last_sent < ALERT_COOLDOWN_SECONDS:
+                # Count the suppressed alert so a summary can be sent later
+                entry.suppressed += 1
+                entry.last_alert = alert
+                self._last_alerts.move_to_end(key)
                 return True
 
-        self._last_alerts[key] = now
-        return False
+            if not self._should_push(alert):
+                # Not sent, so later alerts for this key aren't counted
+                # against a cooldown that never started
+                return True
 
-    def _format_slack_message(self, alert: Alert) -> dict:
-        """Format alert for Slack webhook."""
-        severity_emoji = {
-            AlertSeverity.INFO: ":information_source:",
-            AlertSeverity.WARNING: ":warning:",
-            AlertSeverity.HIGH: ":rotating_light:",
-            AlertSeverity.CRITICAL: ":fire:",
-        }
+            if entry is None:
+                self._last_alerts[key] = _ThrottleEntry(last_sent=now)
+            else:
+                entry.last_sent = now
+            self._last_alerts.move_to_end(key)
+            if len(self._last_alerts) > self._throttle_cap:
+                self._last_alerts.popitem(last=False)
+            return False
 
-        severity_color = {
-            AlertSeverity.INFO: "#36a64f",
-            AlertSeverity.WARNING: "#ffcc00",
-            AlertSeverity.HIGH: "#ff6600",
-            AlertSeverity.CRITICAL: "#ff0000",
-        }
+    def _purge_expired(self, now: float):
+        """Drop throttle entries whose cooldown has elapsed and have nothing pending."""
+        expired = [
+            k for k, e in self._last_alerts.items()
+            if now - e.last_sent >= ALERT_COOLDOWN_SECONDS and not e.suppressed
+        ]
+        for key in expired:
+            del self._last_alerts[key]
+        self._last_purge = now
 
-        emoji = severity_emoji.get(alert.severity, ":bell:")
-        color = severity_color.get(alert.severity, "#808080")
+    def _push_score(self, alert: Alert) -> float:
+        """
+        Score an alert's value in [0, 1] from its severity, the urgency of its
+        type, and its freshness (alerts that waited in the queue decay to 0
+        over one cooldown period).
+        """
+        age = time.time() - alert.timestamp_epoch
+        freshness = max(0.0, 1.0 - age / max(ALERT_COOLDOWN_SECONDS, 1))
+        return (
+            _W_SEVERITY * _SEVERITY_SCORE.get(alert.severity, 0.0)
+            + _W_URGENCY * _URGENCY_SCORE.get(alert.alert_type, 0.5)
+            + _W_FRESHNESS * freshness
+        )
+
+    def _should_push(self, alert: Alert) -> bool:
+        """
+        Decide whether an alert is worth a webhook push: within the per-minute
+        rate limit, and either HIGH/CRITICAL or scoring above the threshold.
+        """
+        if alert.severity not in _HIGH_IMPACT and self._push_score(alert) < ALERT_PUSH_THRESHOLD:
+            return False
+        return self._take_push_slot()
+
+    def _take_push_slot(self) -> bool:
+        """Record a push if the per-minute rate limit allows one."""
+        now = time.monotonic()
+        while self._push_times and now - self._push_times[0] >= 60:
+            self._push_times.popleft()
+        if len(self._push_times) >= ALERT_PUSH_RATE_LIMIT:
+            return False
+        self._push_times.append(now)
+        return True
+
+    async def _collect_suppressed(self) -> List[Alert]:
+        """
+        Build one summary alert per key whose cooldown has expired with
+        suppressed alerts pending, and reset those keys' counters.
+
+        Summaries count against the per-minute push limit; keys over it are
+        left pending, counters intact, for the next flush.
+        """
+        summaries = []
+        deferred = 0
+        async with self._throttle_lock:
+            now = time.monotonic()
+            for entry in self._last_alerts.values():
+                if not entry.suppressed or now - entry.last_sent < ALERT_COOLDOWN_SECONDS:
+                    continue
+                if not self._take_push_slot():
+                    deferred += 1
+                    continue
+                last = entry.last_alert
+                n = entry.suppressed
+                summaries.append(Alert(
+                    alert_type=last.alert_type,
+                    severity=last.severity,
+                    title=f"{last.title} (+{n} more)",
+                    message=(
+                        f"{last.message} {n} similar alert(s) suppressed in the last "
+                        f"{int(now - entry.last_sent)}s."
+                    ),
+                    details={**last.details, "suppressed_count": n},
+                ))
+                entry.last_sent = now
+                entry.suppressed = 0
+                entry.last_alert = None
+        if deferred:
+            logger.debug(f"Rate limited {deferred} alert summaries, retrying next flush")
+        return summaries
+
+    async def _flush_suppressed(self):
+        """Periodically send "N similar alerts suppressed" summaries."""
+        interval = max(ALERT_COOLDOWN_SECONDS / 2, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not self.is_enabled():
+                    continue
+                summaries = await self._collect_suppressed()
+                if summaries:
+                    await asyncio.gather(
+                        *[self._deliver(alert) for alert in summaries],
+                        return_exceptions=True,
+                    )
+            except Exception as e:
+                logger.error(f"Failed to send suppressed-alert summaries: {e}")
+
+    def _format_slack_message(self, alert: Alert) -> dict:
+        """Format alert for Slack webhook."""
+        sk = _SLACK_SKELETON.get(alert.severity, _SLACK_SKELETON_DEFAULT)
 
         # Build fields from details
-        fields = []
-        for key, value in alert.details.items():
-            if value is not None:
-                fields.append({
-                    "title": key.replace("_", " ").title(),
-                    "value": str(value),
-                    "short": True,
-                })
+        fields = [
+            {"title": label, "value": value, "short": True}
+            for label, value in _detail_items(alert.details, _SLACK_MAX_FIELDS)
+        ]
 
         return {
             "attachments": [
                 {
-                    "color": color,
-                    "fallback": f"{emoji} {alert.title}",
-                    "pretext": f"{emoji} *WarDragon Alert*",
+                    "color": sk["color"],
+                    "fallback": f"{sk['emoji']} {alert.title}",
+                    "pretext": sk["pretext"],
                     "title": alert.title,
                     "text": alert.message,
-                    "fields": fields[:10],  # Limit fields
-                    "footer": "WarDragon Analytics",
-                    "ts": int(alert.timestamp.timestamp()),
+                    "fields": fields,
+                    "footer": sk["footer"],
+                    "ts": int(alert.timestamp_epoch),
                 }
             ]
         }
 
     def _format_discord_message(self, alert: Alert) -> dict:
         """Format alert for Discord webhook."""
-        severity_color = {
-            AlertSeverity.INFO: 0x36a64f,
-            AlertSeverity.WARNING: 0xffcc00,
-            AlertSeverity.HIGH: 0xff6600,
-            AlertSeverity.CRITICAL: 0xff0000,
-        }
-
-        color = severity_color.get(alert.severity, 0x808080)
+        sk = _DISCORD_SKELETON.get(alert.severity, _DISCORD_SKELETON_DEFAULT)
 
         # Build fields from details
-        fields = []
-        for key, value in alert.details.items():
-            if value is not None:
-                fields.append({
-                    "name": key.replace("_", " ").title(),
-                    "value": str(value),
-                    "inline": True,
-                })
+        fields = [
+            {"name": label, "value": value, "inline": True}
+            for label, value in _detail_items(alert.details, _DISCORD_MAX_FIELDS)
+        ]
 
         return {
             "embeds": [
                 {
                     "title": f"WarDragon Alert: {alert.title}",
                     "description": alert.message,
-                    "color": color,
-                    "fields": fields[:25],  # Discord limit
-                    "footer": {"text": "WarDragon Analytics"},
+                    "color": sk["color"],
+                    "fields": fields,
+                    "footer": sk["footer"],
                     "timestamp": alert.timestamp.isoformat(),
                 }
             ]
@@ -309,51 +622,170 @@ class AlertManager:
             logger.debug("Alerting disabled, skipping alert")
             return False
 
-        if self._is_throttled(alert):
-            logger.debug(f"Alert throttled: {alert.title}")
+        if await self._is_throttled(alert):
+            logger.debug(f"Alert throttled, below push threshold or rate limited: {alert.title}")
             return False
 
-        client = await self._get_client()
-        success = False
+        return await self._deliver(alert)
 
-        for webhook in self._webhooks:
-            try:
-                # Format message based on webhook type
-                if webhook["type"] == "slack":
-                    payload = self._format_slack_message(alert)
-                elif webhook["type"] == "discord":
-                    payload = self._format_discord_message(alert)
-                else:
-                    payload = self._format_generic_message(alert)
+    async def _deliver(self, alert: Alert) -> bool:
+        """Send an alert to every webhook concurrently (callers apply throttling)."""
+        results = await asyncio.gather(
+            *[self._send_one(webhook, alert) for webhook in self._webhooks],
+            return_exceptions=True,
+        )
+        return any(r is True for r in results)
 
-                headers = {"Content-Type": "application/json"}
-                if webhook.get("headers"):
-                    headers.update(webhook["headers"])
+    async def _send_one(self, webhook: Dict[str, Any], alert: Alert) -> bool:
+        """
+        Send an alert to a single webhook. Returns True on success.
+        Rate limits (429), server errors (5xx) and network errors are retried
+        with jittered exponential backoff, honoring Retry-After.
+        """
+        client = await self._get_client_for(webhook)
+        try:
+            # Format message based on webhook type
+            if webhook["type"] == "slack":
+                payload = self._format_slack_message(alert)
+            elif webhook["type"] == "discord":
+                payload = self._format_discord_message(alert)
+            else:
+                payload = self._format_generic_message(alert)
+
+            body = _dumps(payload)
+        except Exception as e:
+            logger.error(f"Failed to format alert for {webhook['name']}: {e}")
+            return False
 
+        deadline = time.monotonic() + WEBHOOK_RETRY_BUDGET_SECONDS
+        for attempt in range(WEBHOOK_MAX_ATTEMPTS):
+            delay = None
+            try:
                 response = await client.post(
                     webhook["url"],
-                    json=payload,
-                    headers=headers,
+                    content=body,
+                    headers=webhook["request_headers"],
                 )
 
                 if response.status_code in (200, 201, 204):
                     logger.info(f"Alert sent to {webhook['name']}: {alert.title}")
-                    success = True
+                    return True
+
+                if response.status_code == 429:
+                    delay = _retry_after(response, default=2 ** attempt)
+                elif 500 <= response.status_code < 600:
+                    delay = 2 ** attempt
                 else:
                     logger.warning(
                         f"Webhook {webhook['name']} returned {response.status_code}: {response.text[:100]}"
                     )
+                    return False
+
+                error = f"HTTP {response.status_code}"
 
+            except httpx.TransportError as e:
+                delay = 2 ** attempt
+                error = str(e) or type(e).__name__
             except Exception as e:
                 logger.error(f"Failed to send alert to {webhook['name']}: {e}")
+                return False
 
-        return success
+            delay += random.uniform(0, 0.3)
+            if attempt + 1 >= WEBHOOK_MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+                logger.error(
+                    f"Failed to send alert to {webhook['name']} after {attempt + 1} attempt(s): {error}"
+                )
+                return False
+
+            logger.debug(
+                f"Webhook {webhook['name']} {error}, retrying in {delay:.1f}s "
+                f"({attempt + 1}/{WEBHOOK_MAX_ATTEMPTS})"
+            )
+            await asyncio.sleep(delay)
+
+        return False
+
+    async def start(self):
+        """Start the background worker that drains the alert queue."""
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        """Launch the queue worker if it is not already running."""
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._drain())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_suppressed())
+
+    def enqueue(self, alert: Alert) -> bool:
+        """
+        Queue an alert for background delivery without waiting on webhooks.
+        Returns True if the alert was queued.
+        """
+        if not self.is_enabled():
+            return False
+
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(alert)
+        except asyncio.QueueFull:
+            logger.warning(f"Alert queue full, dropping alert: {alert.title}")
+            return False
+        return True
+
+    async def _drain(self):
+        """
+        Pull queued alerts and dispatch each one as its own task, so a slow
+        webhook only holds up its own alert. A semaphore bounds the number of
+        deliveries in flight.
+        """
+        slots = asyncio.Semaphore(ALERT_MAX_IN_FLIGHT)
+        while True:
+            alert = await self._queue.get()
+            await slots.acquire()
+            task = asyncio.create_task(self._dispatch(alert, slots))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, alert: Alert, slots: asyncio.Semaphore):
+        """Send one queued alert, then free its delivery slot."""
+        try:
+            await self.send_alert(alert)
+        except Exception as e:
+            logger.error(f"Failed to send queued alert {alert.title}: {e}")
+        finally:
+            slots.release()
+            self._queue.task_done()
 
     async def close(self):
-        """Close HTTP client."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """
+        Deliver queued alerts (waiting up to ALERT_CLOSE_DRAIN_SECONDS), then
+        stop background tasks and close HTTP clients.
+        """
+        if self._worker_task is not None and not self._worker_task.done():
+            try:
+                await asyncio.wait_for(self._queue.join(), ALERT_CLOSE_DRAIN_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out delivering queued alerts on close")
+
+        for task in (self._worker_task, self._flush_task, *self._in_flight):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._worker_task = None
+        self._flush_task = None
+        self._in_flight.clear()
+        # The queue binds to the running loop; start() may run on a new one
+        if self._queue.qsize():
+            logger.warning(f"Dropping {self._queue.qsize()} undelivered alerts on close")
+        self._queue = asyncio.Queue(maxsize=ALERT_QUEUE_SIZE)
+
+        for webhook in self._webhooks:
+            if webhook["client"] is not None:
+                await webhook["client"].aclose()
+                webhook["client"] = None
 
 
 # =============================================================================
@@ -367,6 +799,17 @@ alert_manager = AlertManager()
 # Helper Functions for Common Alerts
 # =============================================================================
 
+def _alerting_required(func):
+    """Skip building the alert entirely when alerting is disabled (the default)."""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not alert_manager.is_enabled():
+            return False
+        return await func(*args, **kwargs)
+    return wrapper
+
+
+@_alerting_required
 async def alert_new_drone(drone_id: str, rid_make: str = None, lat: float = None,
                           lon: float = None, kit_id: str = None):
     """Send alert for a new drone detection."""
@@ -383,9 +826,10 @@ async def alert_new_drone(drone_id: str, rid_make: str = None, lat: float = None
             "kit_id": kit_id,
         },
     )
-    return await alert_manager.send_alert(alert)
+    return alert_manager.enqueue(alert)
 
 
+@_alerting_required
 async def alert_watchlist_match(drone_id: str, watchlist_entry: str = None,
                                  lat: float = None, lon: float = None):
     """Send alert for a watchlist match."""
@@ -401,9 +845,10 @@ async def alert_watchlist_match(drone_id: str, watchlist_entry: str = None,
             "longitude": lon,
         },
     )
-    return await alert_manager.send_alert(alert)
+    return alert_manager.enqueue(alert)
 
 
+@_alerting_required
 async def alert_security_event(title: str, message: str, severity: AlertSeverity,
                                 details: dict = None):
     """Send a generic security alert."""
@@ -414,9 +859,10 @@ async def alert_security_event(title: str, message: str, severity: AlertSeverity
         message=message,
         details=details or {},
     )
-    return await alert_manager.send_alert(alert)
+    return alert_manager.enqueue(alert)
 
 
+@_alerting_required
 async def alert_fpv_signal(freq_mhz: float, power_dbm: float = None,
                            lat: float = None, lon: float = None, kit_id: str = None):
     """Send alert for FPV signal detection."""
@@ -433,9 +879,10 @@ async def alert_fpv_signal(freq_mhz: float, power_dbm: float = None,
             "kit_id": kit_id,
         },
     )
-    return await alert_manager.send_alert(alert)
+    return alert_manager.enqueue(alert)
 
 
+@_alerting_required
 async def alert_kit_status(kit_id: str, status: str, kit_name: str = None):
     """Send alert for kit status change."""
     is_offline = status.lower() == "offline"
@@ -450,9 +897,10 @@ async def alert_kit_status(kit_id: str, status: str, kit_name: str = None):
             "status": status,
         },
     )
-    return await alert_manager.send_alert(alert)
+    return alert_manager.enqueue(alert)
 
 
+@_alerting_required
 async def alert_anomaly(drone_id: str, anomaly_type: str, severity: AlertSeverity,
                         details: dict = None):
     """Send alert for detected anomaly."""
@@ -463,7 +911,7 @@ async def alert_anomaly(drone_id: str, anomaly_type: str, severity: AlertSeverit
         message=f"Anomalous behavior detected for drone {drone_id}.",
         details={"drone_id": drone_id, "anomaly_type": anomaly_type, **(details or {})},
     )
-    return await alert_manager.send_alert(alert)
+    return alert_manager.enqueue(alert)
 
 
 # =============================================================================
@@ -11,8 +11,13 @@ Enterprise Features (Optional):
 """
 
 import os
+import time
+import hashlib
+import asyncio
 import logging
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional
 from pathlib import Path
 
@@ -21,11 +26,19 @@ from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse, Red
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, HttpUrl
 import asyncpg
-import csv
-import io
+import httpx
 import re
 import math
 
+# orjson (if installed) serializes responses several times faster than stdlib json
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponseClass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    DefaultResponseClass = JSONResponse
+    ORJSON_AVAILABLE = False
+
 # Import optional enterprise modules
 try:
     from auth import (
@@ -74,12 +87,17 @@ DATABASE_URL = os.environ.get(
 API_TITLE = os.environ.get("API_TITLE", "WarDragon Analytics API")
 API_VERSION = os.environ.get("API_VERSION", "1.0.0")
 MAX_QUERY_RANGE_HOURS = int(os.environ.get("MAX_QUERY_RANGE_HOURS", "168"))  # 7 days default
+# Fixed pool size: connections are opened up front rather than on demand
+DB_POOL_SIZE = max(1, int(os.environ.get("DB_POOL_SIZE", "8")))
+# Server-side limit for any single API query (Postgres interval syntax)
+DB_STATEMENT_TIMEOUT = os.environ.get("DB_STATEMENT_TIMEOUT", "30s")
 
 # Initialize FastAPI app
 app = FastAPI(
     title=API_TITLE,
     version=API_VERSION,
-    description="Multi-kit drone surveillance aggregation and visualization"
+    description="Multi-kit drone surveillance aggregation and visualization",
+    default_response_class=DefaultResponseClass
 )
 
 # Mount static files directory
@@ -91,6 +109,50 @@ if static_dir.exists():
 # Database connection pool
 db_pool: Optional[asyncpg.Pool] = None
 
+# Database liveness, refreshed by a background probe so /health doesn't hit the pool
+HEALTH_PROBE_INTERVAL_SECONDS = 5.0
+HEALTH_STALE_SECONDS = 3 * HEALTH_PROBE_INTERVAL_SECONDS
+HEALTH_STATE = {"ok": False, "ts": 0.0, "error": None}
+_health_task: Optional[asyncio.Task] = None
+
+# Short-lived cache of the full /api/kits listing; dashboards poll it every few
+# seconds from every open browser, so concurrent polls share one query
+KITS_CACHE_TTL_SECONDS = float(os.environ.get("KITS_CACHE_TTL_SECONDS", "2"))
+_kits_cache = {"ts": 0.0, "data": None, "lock": asyncio.Lock()}
+
+# Recent anomaly and multi-kit results per time window; dashboards re-request
+# the same window every few seconds, so those polls share one query
+PATTERN_CACHE_TTL_SECONDS = float(os.environ.get("PATTERN_CACHE_TTL_SECONDS", "5"))
+PATTERN_CACHE_SIZE = 256
+_pattern_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_pattern_locks = defaultdict(asyncio.Lock)
+
+# Kit GPS positions per (kit_id, minute of target time) for location estimates;
+# kits rarely move, so repeated estimates around the same time reuse them
+KIT_POSITION_CACHE_TTL_SECONDS = 60.0
+KIT_POSITION_CACHE_SIZE = 4096
+_kit_position_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Kit API client, shared so status probes reuse connections instead of paying
+# a TCP (and TLS) handshake each time; created on first use
+KIT_HTTP_TIMEOUT = httpx.Timeout(10.0)
+KIT_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+_kit_http: Optional[httpx.AsyncClient] = None
+
+# Recent probe results per kit URL; polling dashboards re-test the same kits
+# every few seconds, and concurrent tests of one URL share a single request
+KIT_PROBE_CACHE_TTL_SECONDS = 2.0
+KIT_PROBE_CACHE_SIZE = 1024
+_probe_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_probe_locks = defaultdict(asyncio.Lock)
+
+# Compiled once at import rather than per request
+_API_URL_RE = re.compile(r'^https?://[^\s/:]+(?::\d+)?(?:/.*)?$')
+
 
 # Pydantic models
 class KitStatus(BaseModel):
@@ -264,15 +326,40 @@ class KitTestResult(BaseModel):
 @app.on_event("startup")
 async def startup():
     """Initialize database connection pool on startup."""
-    global db_pool
+    global db_pool, _health_task
     try:
         db_pool = await asyncpg.create_pool(
             DATABASE_URL,
-            min_size=2,
-            max_size=10,
-            command_timeout=60
+            min_size=DB_POOL_SIZE,
+            max_size=DB_POOL_SIZE,
+            max_inactive_connection_lifetime=300,
+            statement_cache_size=1024,
+            # Keep prepared statements for the life of the connection; the
+            # query set is fixed, so there is nothing to age out
+            max_cached_statement_lifetime=0,
+            command_timeout=60,
+            # Startup parameters rather than SET in init: the pool runs RESET ALL
+            # when a connection is released, which would undo a SET. JIT is off
+            # because its compile cost is never repaid by these short queries.
+            server_settings={
+                "jit": "off",
+                "statement_timeout": DB_STATEMENT_TIMEOUT,
+                "idle_in_transaction_session_timeout": "60s",
+            },
+            init=_init_connection
         )
-        logger.info("Database connection pool initialized")
+        # Warm every connection so the first requests don't pay for it
+        await asyncio.gather(*[db_pool.execute("SELECT 1") for _ in range(DB_POOL_SIZE)])
+        logger.info(f"Database connection pool initialized ({DB_POOL_SIZE} connections)")
+        logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
+
+        try:
+            await _backfill_kit_source()
+        except Exception as e:
+            logger.warning(f"Could not backfill kit source column: {e}")
+        await _ensure_enabled_column()
+
+        _health_task = asyncio.create_task(_health_loop())
     except Exception as e:
         logger.error(f"Failed to initialize database pool: {e}")
         raise
@@ -281,43 +368,369 @@ async def startup():
 @app.on_event("shutdown")
 async def shutdown():
     """Close database connection pool on shutdown."""
-    global db_pool
+    global db_pool, _kit_http
+    if _health_task:
+        _health_task.cancel()
+    if _kit_http:
+        await _kit_http.aclose()
+        _kit_http = None
     if db_pool:
         await db_pool.close()
         logger.info("Database connection pool closed")
 
 
 # Helper functions
+def _record_default(obj):
+    # orjson calls this for types it can't encode natively; asyncpg rows are
+    # the only ones we hand it, so fetch() results need no dict() copy first
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj)
+    raise TypeError
+
+
+def _raw_json(content: dict):
+    """
+    Return a listing body as a ready response, skipping FastAPI's jsonable_encoder pass.
+
+    Only for DB-shaped dicts of plain values (str/int/float/bool/None/datetime)
+    and asyncpg Records; without orjson the dict is returned for FastAPI to
+    encode as usual.
+    """
+    if ORJSON_AVAILABLE:
+        return Response(
+            orjson.dumps(content, default=_record_default, option=orjson.OPT_NON_STR_KEYS),
+            media_type="application/json",
+        )
+    return content
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows fetched per cursor round trip when streaming NDJSON
+_NDJSON_PREFETCH_ROWS = 1000
+
+
+def _wants_ndjson(request: Request) -> bool:
+    """Whether the client asked for newline-delimited JSON rows."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _ndjson_line(row: dict) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(row) + b"\n"
+    import json
+    from fastapi.encoders import jsonable_encoder
+    return json.dumps(jsonable_encoder(row)).encode() + b"\n"
+
+
+async def _ndjson_rows(query: str, params: list):
+    """Yield query rows as NDJSON lines from a server-side cursor."""
+    async with db_pool.acquire() as conn:
+        async with conn.transaction(readonly=True):
+            # The transaction stays open while a slow client reads the stream
+            await conn.execute("SET LOCAL idle_in_transaction_session_timeout = 0")
+            async for record in conn.cursor(query, *params, prefetch=_NDJSON_PREFETCH_ROWS):
+                yield _ndjson_line(dict(record))
+
+
+async def _ndjson_response(query: str, params: list) -> StreamingResponse:
+    """
+    Stream query rows as NDJSON instead of building the whole list in memory.
+
+    The first row is fetched before responding so query errors still surface
+    as a 500 rather than a truncated stream.
+    """
+    rows = _ndjson_rows(query, params)
+    try:
+        first = await rows.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def body():
+        try:
+            if first is not None:
+                yield first
+                async for line in rows:
+                    yield line
+        finally:
+            await rows.aclose()
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _invalidate_kits_cache():
+    """Drop the cached kit listing after kits are added, changed or removed."""
+    _kits_cache.update(ts=0.0, data=None)
+
+
+async def _cached_kit_status() -> List[dict]:
+    """get_kit_status() for all kits, reused for KITS_CACHE_TTL_SECONDS."""
+    def fresh():
+        return (_kits_cache["data"] is not None
+                and time.monotonic() - _kits_cache["ts"] < KITS_CACHE_TTL_SECONDS)
+
+    if fresh():
+        return _kits_cache["data"]
+    async with _kits_cache["lock"]:
+        # Another request may have refreshed it while we waited
+        if fresh():
+            return _kits_cache["data"]
+        kits = await get_kit_status()
+        _kits_cache.update(ts=time.monotonic(), data=kits)
+        return kits
+
+
+async def _ttl_cached(cache: OrderedDict, locks: defaultdict, key, ttl: float, max_size: int, compute):
+    """
+    Return compute()'s result for key, reusing one computed less than ttl seconds ago.
+
+    Concurrent misses for the same key wait for a single compute() call. The
+    cache holds at most max_size keys, dropping the least recently refreshed.
+    """
+    def fresh():
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry
+        return None
+
+    entry = fresh()
+    if entry is not None:
+        return entry[1]
+    async with locks[key]:
+        # Another caller may have refreshed it while we waited
+        entry = fresh()
+        if entry is not None:
+            return entry[1]
+        value = await compute()
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            evicted, _ = cache.popitem(last=False)
+            locks.pop(evicted, None)
+        return value
+
+
+def _clear_pattern_cache():
+    """Drop cached pattern query results and kit positions."""
+    _pattern_cache.clear()
+    _kit_position_cache.clear()
+
+
+async def _probe_database():
+    """Ping the database once and record the result in HEALTH_STATE."""
+    try:
+        await db_pool.fetchval("SELECT 1")
+        HEALTH_STATE.update(ok=True, error=None)
+    except Exception as e:
+        HEALTH_STATE.update(ok=False, error=str(e))
+    HEALTH_STATE["ts"] = time.monotonic()
+
+
+async def _health_loop():
+    """Refresh HEALTH_STATE every HEALTH_PROBE_INTERVAL_SECONDS."""
+    while True:
+        await _probe_database()
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL_SECONDS)
+
+
+# Relative time_range values in seconds, already capped at the max query range;
+# anything unrecognised falls back to 1h
+_RANGE_TABLE = {
+    key: min(hours, MAX_QUERY_RANGE_HOURS) * 3600
+    for key, hours in (("1h", 1), ("24h", 24), ("7d", 7 * 24))
+}
+
+
+@lru_cache(maxsize=256)
+def _relative_range(time_range: str, now_s: int) -> tuple[datetime, datetime]:
+    """Start/end for a relative range ending at now_s (whole epoch seconds)."""
+    return (
+        datetime.fromtimestamp(now_s - _RANGE_TABLE[time_range], timezone.utc),
+        datetime.fromtimestamp(now_s, timezone.utc),
+    )
+
+
+@lru_cache(maxsize=256)
+def _custom_range(time_range: str) -> Optional[tuple[datetime, datetime]]:
+    """Parse custom:START,END (ISO 8601); None if malformed."""
+    try:
+        _, times = time_range.split(":", 1)
+        start_str, end_str = times.split(",", 1)
+        return datetime.fromisoformat(start_str), datetime.fromisoformat(end_str)
+    except Exception as e:
+        logger.warning(f"Invalid custom time range format: {time_range}, error: {e}")
+        return None
+
+
 def parse_time_range(time_range: str) -> tuple[datetime, datetime]:
     """Parse time_range parameter into start and end datetimes."""
-    now = datetime.utcnow()
-
-    if time_range == "1h":
-        start_time = now - timedelta(hours=1)
-    elif time_range == "24h":
-        start_time = now - timedelta(hours=24)
-    elif time_range == "7d":
-        start_time = now - timedelta(days=7)
-    elif time_range.startswith("custom:"):
+    # A plain prefix check is all the dispatch needs; no regex on this path
+    if time_range.startswith("custom:"):
         # Format: custom:YYYY-MM-DDTHH:MM:SS,YYYY-MM-DDTHH:MM:SS
-        try:
-            _, times = time_range.split(":", 1)
-            start_str, end_str = times.split(",", 1)
-            start_time = datetime.fromisoformat(start_str)
-            end_time = datetime.fromisoformat(end_str)
-            return start_time, end_time
-        except Exception as e:
-            logger.warning(f"Invalid custom time range format: {time_range}, error: {e}")
-            start_time = now - timedelta(hours=1)
-    else:
-        start_time = now - timedelta(hours=1)
+        custom = _custom_range(time_range)
+        if custom:
+            return custom
+    # Requests within the same second share the cached (start, end)
+    now_s = time.time_ns() // 1_000_000_000
+    return _relative_range(time_range if time_range in _RANGE_TABLE else "1h", now_s)
+
+
+# Kit status from last_seen. Online threshold: 60s (kits send every 30s, allow buffer)
+_KIT_STATUS_SQL = """
+    CASE
+        WHEN last_seen IS NULL THEN 'unknown'
+        WHEN NOW() - last_seen < INTERVAL '60 seconds' THEN 'online'
+        WHEN NOW() - last_seen < INTERVAL '180 seconds' THEN 'stale'
+        ELSE 'offline'
+    END
+"""
+
+# Kit listing queries (source column was added by 05-mqtt-support.sql)
+_KITS_SELECT_WITH_SOURCE = f"""
+    SELECT kit_id, name, location, api_url, last_seen, {_KIT_STATUS_SQL} AS status,
+           created_at, source
+    FROM kits
+"""
+_KITS_SELECT_LEGACY = f"""
+    SELECT kit_id, name, location, api_url, last_seen, {_KIT_STATUS_SQL} AS status,
+           created_at, 'http' as source
+    FROM kits
+"""
+# Registered kits plus kits seen in drone data (last 7 days) that were never
+# registered, in a single round trip; discovered kits get source 'discovered'
+_KITS_ALL_TEMPLATE = """
+    WITH registered AS ({select}),
+    discovered AS (
+        SELECT d.kit_id, MAX(d.time) AS last_seen
+        FROM drones d
+        WHERE d.time > NOW() - INTERVAL '7 days'
+          AND d.kit_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM kits k WHERE k.kit_id = d.kit_id)
+        GROUP BY d.kit_id
+    )
+    SELECT * FROM (
+        SELECT * FROM registered
+        UNION ALL
+        SELECT kit_id, 'Discovered: ' || kit_id, NULL, NULL, last_seen, {status} AS status,
+               NULL, 'discovered'
+        FROM discovered
+    ) all_kits
+    ORDER BY COALESCE(NULLIF(name, ''), kit_id) COLLATE "C"
+"""
+QUERY_KITS_ALL_WITH_SOURCE = _KITS_ALL_TEMPLATE.format(
+    select=_KITS_SELECT_WITH_SOURCE, status=_KIT_STATUS_SQL
+)
+QUERY_KITS_ALL_LEGACY = _KITS_ALL_TEMPLATE.format(
+    select=_KITS_SELECT_LEGACY, status=_KIT_STATUS_SQL
+)
+QUERY_KITS_BY_ID_WITH_SOURCE = _KITS_SELECT_WITH_SOURCE + "WHERE kit_id = $1"
+QUERY_KITS_BY_ID_LEGACY = _KITS_SELECT_LEGACY + "WHERE kit_id = $1"
+
+# Latest system_health row (position and health) per kit in the last hour
+QUERY_KIT_HEALTH = """
+    SELECT DISTINCT ON (kit_id)
+        kit_id, lat, lon, alt,
+        cpu_percent, memory_percent, disk_percent,
+        temp_cpu, temp_gpu, pluto_temp, zynq_temp,
+        uptime_hours, gps_fix, time as health_time
+    FROM system_health
+    WHERE time > NOW() - INTERVAL '1 hour'
+    ORDER BY kit_id, time DESC
+"""
+
+# Whether kits.source exists; schema doesn't change at runtime, so checked once
+KITS_HAS_SOURCE: Optional[bool] = None
+
+
+async def _kits_has_source_column(conn=None) -> bool:
+    """Return whether the kits table has a source column (cached after first check)."""
+    global KITS_HAS_SOURCE
+    if KITS_HAS_SOURCE is None:
+        KITS_HAS_SOURCE = await (conn or db_pool).fetchval("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_attribute
+                WHERE attrelid = 'kits'::regclass AND attname = 'source'
+                  AND NOT attisdropped
+            )
+        """)
+    return KITS_HAS_SOURCE
+
+
+async def _backfill_kit_source():
+    """
+    Give every kit a source so the listing query can select the column as-is.
+
+    Kits registered before 05-mqtt-support.sql was applied may have a NULL
+    source; they were all HTTP-polled. Runs once at startup. The column
+    default lives in 05-mqtt-support.sql, so this only touches data.
+    """
+    if not await _kits_has_source_column():
+        return
+    backfilled = await db_pool.fetchval("""
+        WITH u AS (UPDATE kits SET source = 'http' WHERE source IS NULL RETURNING 1)
+        SELECT count(*) FROM u
+    """)
+    if backfilled:
+        logger.info(f"Backfilled kit source column for {backfilled} kits")
+
+
+def _encode_utc_timestamp(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _decode_utc_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def _encode_json(value) -> str:
+    # Already-serialized text (e.g. audit details) is passed through as is
+    if isinstance(value, str):
+        return value
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    import json
+    return json.dumps(value)
+
+
+def _decode_json(value: str):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    import json
+    return json.loads(value)
 
-    # Enforce max query range
-    max_range = timedelta(hours=MAX_QUERY_RANGE_HOURS)
-    if now - start_time > max_range:
-        start_time = now - max_range
 
-    return start_time, now
+async def _init_connection(conn: asyncpg.Connection):
+    """Set up each new pool connection.
+
+    Plain timestamp values are decoded as aware UTC datetimes (timestamptz
+    already is), so callers never need to patch tzinfo.
+
+    json/jsonb values (json_agg columns, pattern detection functions) are
+    decoded into Python objects, so they reach clients as nested JSON rather
+    than as strings.
+
+    numeric values (e.g. AVG() over integer columns in assistant queries) are
+    decoded as floats rather than Decimal; nothing here needs exact decimals,
+    and floats serialize as JSON numbers.
+    """
+    await conn.set_type_codec(
+        "timestamp", schema="pg_catalog",
+        encoder=_encode_utc_timestamp, decoder=_decode_utc_timestamp, format="text"
+    )
+    # orjson.loads takes str directly, so it can be the decoder itself rather
+    # than paying for the _decode_json wrapper call on every value
+    json_decoder = orjson.loads if ORJSON_AVAILABLE else _decode_json
+    for json_type in ("json", "jsonb"):
+        await conn.set_type_codec(
+            json_type, schema="pg_catalog",
+            encoder=_encode_json, decoder=json_decoder, format="text"
+        )
+    await conn.set_type_codec(
+        "numeric", schema="pg_catalog",
+        encoder=str, decoder=float, format="text"
+    )
 
 
 async def get_kit_status(kit_id: Optional[str] = None) -> List[dict]:
@@ -325,177 +738,83 @@ async def get_kit_status(kit_id: Optional[str] = None) -> List[dict]:
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
 
-    async with db_pool.acquire() as conn:
-        # Check if source column exists (for backwards compatibility)
-        source_exists = await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.columns
-                WHERE table_name = 'kits' AND column_name = 'source'
-            )
-        """)
+    # Registered kits, plus unregistered kits discovered from drone data when
+    # listing all (source column may be absent on old schemas)
+    has_source = await _kits_has_source_column()
+    if kit_id:
+        query = QUERY_KITS_BY_ID_WITH_SOURCE if has_source else QUERY_KITS_BY_ID_LEGACY
+        params = [kit_id]
+    else:
+        query = QUERY_KITS_ALL_WITH_SOURCE if has_source else QUERY_KITS_ALL_LEGACY
+        params = []
+
+    # Kits and their latest health (including location) are independent, so
+    # both queries run at once; each connection goes back to the pool as soon
+    # as its rows arrive, before any of the merging below
+    rows, health_rows = await asyncio.gather(
+        db_pool.fetch(query, *params),
+        db_pool.fetch(QUERY_KIT_HEALTH),
+    )
 
-        # Get registered kits from kits table
-        if kit_id:
-            if source_exists:
-                query = """
-                    SELECT kit_id, name, location, api_url, last_seen, status, created_at,
-                           COALESCE(source, 'http') as source
-                    FROM kits
-                    WHERE kit_id = $1
-                """
-            else:
-                query = """
-                    SELECT kit_id, name, location, api_url, last_seen, status, created_at,
-                           'http' as source
-                    FROM kits
-                    WHERE kit_id = $1
-                """
-            rows = await conn.fetch(query, kit_id)
+    # Status is bucketed and the list sorted by name (then kit_id) in SQL
+    kits = [dict(row) for row in rows]
+
+    # Records support .get() by column name, so no per-row dict copy is needed
+    kit_health = {row["kit_id"]: row for row in health_rows}
+
+    # Add health data to each kit
+    for kit in kits:
+        kit_id = kit["kit_id"]
+        if kit_id in kit_health:
+            health = kit_health[kit_id]
+            # Location
+            kit["lat"] = health.get("lat")
+            kit["lon"] = health.get("lon")
+            kit["alt"] = health.get("alt")
+            # System health
+            kit["cpu_percent"] = health.get("cpu_percent")
+            kit["memory_percent"] = health.get("memory_percent")
+            kit["disk_percent"] = health.get("disk_percent")
+            kit["temp_cpu"] = health.get("temp_cpu")
+            kit["temp_gpu"] = health.get("temp_gpu")
+            kit["pluto_temp"] = health.get("pluto_temp")
+            kit["zynq_temp"] = health.get("zynq_temp")
+            kit["uptime_hours"] = health.get("uptime_hours")
+            kit["gps_fix"] = health.get("gps_fix")
+            kit["health_time"] = health.get("health_time")
         else:
-            if source_exists:
-                query = """
-                    SELECT kit_id, name, location, api_url, last_seen, status, created_at,
-                           COALESCE(source, 'http') as source
-                    FROM kits
-                    ORDER BY name
-                """
-            else:
-                query = """
-                    SELECT kit_id, name, location, api_url, last_seen, status, created_at,
-                           'http' as source
-                    FROM kits
-                    ORDER BY name
-                """
-            rows = await conn.fetch(query)
-
-        # Build dict of registered kits
-        kits_dict = {}
-        now = datetime.now(timezone.utc)
-        for row in rows:
-            kit = dict(row)
-            if kit["last_seen"]:
-                # Handle both timezone-aware and naive datetimes from DB
-                last_seen = kit["last_seen"]
-                if last_seen.tzinfo is None:
-                    last_seen = last_seen.replace(tzinfo=timezone.utc)
-                time_since_seen = (now - last_seen).total_seconds()
-                # Online threshold: 60s (kits send every 30s, allow buffer)
-                if time_since_seen < 60:
-                    kit["status"] = "online"
-                elif time_since_seen < 180:
-                    kit["status"] = "stale"
-                else:
-                    kit["status"] = "offline"
-            else:
-                kit["status"] = "unknown"
-            kits_dict[kit["kit_id"]] = kit
-
-        # Also discover kits from drone data (last 7 days) that aren't registered
-        # This catches kits that have data but weren't formally registered
-        if not kit_id:
-            discovered_query = """
-                SELECT DISTINCT kit_id, MAX(time) as last_seen
-                FROM drones
-                WHERE time > NOW() - INTERVAL '7 days'
-                  AND kit_id IS NOT NULL
-                GROUP BY kit_id
-            """
-            discovered_rows = await conn.fetch(discovered_query)
-
-            for row in discovered_rows:
-                discovered_kit_id = row["kit_id"]
-                if discovered_kit_id and discovered_kit_id not in kits_dict:
-                    # Create a discovered kit entry
-                    last_seen = row["last_seen"]
-                    if last_seen:
-                        if last_seen.tzinfo is None:
-                            last_seen = last_seen.replace(tzinfo=timezone.utc)
-                        time_since_seen = (now - last_seen).total_seconds()
-                    else:
-                        time_since_seen = float('inf')
-
-                    # Online threshold: 60s (kits send every 30s, allow buffer)
-                    if time_since_seen < 60:
-                        status = "online"
-                    elif time_since_seen < 180:
-                        status = "stale"
-                    else:
-                        status = "offline"
-
-                    kits_dict[discovered_kit_id] = {
-                        "kit_id": discovered_kit_id,
-                        "name": f"Discovered: {discovered_kit_id}",
-                        "location": None,
-                        "api_url": None,
-                        "last_seen": last_seen,
-                        "status": status,
-                        "created_at": None,
-                        "source": "discovered"  # Special source indicating auto-discovered from data
-                    }
-
-        # Fetch latest health data (including location) from system_health for each kit
-        health_query = """
-            SELECT DISTINCT ON (kit_id)
-                kit_id, lat, lon, alt,
-                cpu_percent, memory_percent, disk_percent,
-                temp_cpu, temp_gpu, pluto_temp, zynq_temp,
-                uptime_hours, gps_fix, time as health_time
-            FROM system_health
-            WHERE time > NOW() - INTERVAL '1 hour'
-            ORDER BY kit_id, time DESC
-        """
-        health_rows = await conn.fetch(health_query)
-        kit_health = {row["kit_id"]: dict(row) for row in health_rows}
-
-        # Add health data to each kit
-        for kit_id, kit in kits_dict.items():
-            if kit_id in kit_health:
-                health = kit_health[kit_id]
-                # Location
-                kit["lat"] = health.get("lat")
-                kit["lon"] = health.get("lon")
-                kit["alt"] = health.get("alt")
-                # System health
-                kit["cpu_percent"] = health.get("cpu_percent")
-                kit["memory_percent"] = health.get("memory_percent")
-                kit["disk_percent"] = health.get("disk_percent")
-                kit["temp_cpu"] = health.get("temp_cpu")
-                kit["temp_gpu"] = health.get("temp_gpu")
-                kit["pluto_temp"] = health.get("pluto_temp")
-                kit["zynq_temp"] = health.get("zynq_temp")
-                kit["uptime_hours"] = health.get("uptime_hours")
-                kit["gps_fix"] = health.get("gps_fix")
-                kit["health_time"] = health.get("health_time")
-            else:
-                kit["lat"] = None
-                kit["lon"] = None
-                kit["alt"] = None
-                kit["cpu_percent"] = None
-                kit["memory_percent"] = None
-                kit["disk_percent"] = None
-                kit["temp_cpu"] = None
-                kit["uptime_hours"] = None
-                kit["gps_fix"] = None
-
-        # Sort by name and return as list
-        kits = sorted(kits_dict.values(), key=lambda k: k.get("name") or k.get("kit_id") or "")
-        return kits
+            kit["lat"] = None
+            kit["lon"] = None
+            kit["alt"] = None
+            kit["cpu_percent"] = None
+            kit["memory_percent"] = None
+            kit["disk_percent"] = None
+            kit["temp_cpu"] = None
+            kit["uptime_hours"] = None
+            kit["gps_fix"] = None
+
+    return kits
 
 
 # API Endpoints
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for Docker healthcheck."""
+    """
+    Health check endpoint for Docker healthcheck.
+
+    Serves the result of the background database probe; only probes inline
+    when that result is stale (probe loop not running or stuck).
+    """
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database pool not initialized")
 
-    try:
-        async with db_pool.acquire() as conn:
-            await conn.fetchval("SELECT 1")
-        return {"status": "healthy"}
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        raise HTTPException(status_code=503, detail=f"Database connection failed: {e}")
+    if time.monotonic() - HEALTH_STATE["ts"] > HEALTH_STALE_SECONDS:
+        await _probe_database()
+
+    if not HEALTH_STATE["ok"]:
+        logger.error(f"Health check failed: {HEALTH_STATE['error']}")
+        raise HTTPException(status_code=503, detail=f"Database connection failed: {HEALTH_STATE['error']}")
+    return {"status": "healthy"}
 
 
 @app.get("/api/kits")
@@ -507,8 +826,8 @@ async def list_kits(kit_id: Optional[str] = Query(None, description="Filter by s
         List of kit objects with status, last seen time, etc.
     """
     try:
-        kits = await get_kit_status(kit_id)
-        return {"kits": kits, "count": len(kits)}
+        kits = await get_kit_status(kit_id) if kit_id else await _cached_kit_status()
+        return _raw_json({"kits": kits, "count": len(kits)})
     except Exception as e:
         logger.error(f"Failed to list kits: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -518,17 +837,29 @@ async def list_kits(kit_id: Optional[str] = Query(None, description="Filter by s
 # Kit Management Admin Endpoints
 # =============================================================================
 
+# Set once the kits.enabled column is known to exist
+_enabled_column_ready = False
+
+
 async def _ensure_enabled_column():
-    """Ensure the 'enabled' column exists in the kits table (migration-safe)."""
-    if not db_pool:
+    """
+    Ensure the 'enabled' column exists in the kits table (migration-safe).
+
+    Runs at startup; admin handlers still call it, but after the first success
+    it returns without touching the database.
+    """
+    global _enabled_column_ready
+    if _enabled_column_ready or not db_pool:
         return
     try:
         async with db_pool.acquire() as conn:
-            # Check if column exists
+            # Check if column exists; pg_attribute directly, skipping the
+            # joins and privilege checks behind information_schema
             exists = await conn.fetchval("""
                 SELECT EXISTS (
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_name = 'kits' AND column_name = 'enabled'
+                    SELECT 1 FROM pg_attribute
+                    WHERE attrelid = 'kits'::regclass AND attname = 'enabled'
+                      AND NOT attisdropped
                 )
             """)
             if not exists:
@@ -536,38 +867,52 @@ async def _ensure_enabled_column():
                     ALTER TABLE kits ADD COLUMN enabled BOOLEAN DEFAULT TRUE
                 """)
                 logger.info("Added 'enabled' column to kits table")
+        _enabled_column_ready = True
     except Exception as e:
         logger.warning(f"Could not add enabled column (may already exist): {e}")
 
 
-async def _test_kit_connection(api_url: str) -> KitTestResult:
-    """Test connection to a kit's API and retrieve its kit_id."""
-    import httpx
-    import time
+def _get_kit_http() -> httpx.AsyncClient:
+    """Return the shared kit API client, creating it on first use."""
+    global _kit_http
+    if _kit_http is None or _kit_http.is_closed:
+        _kit_http = httpx.AsyncClient(timeout=KIT_HTTP_TIMEOUT, limits=KIT_HTTP_LIMITS)
+    return _kit_http
 
+
+async def _test_kit_connection(api_url: str) -> KitTestResult:
+    """Test connection to a kit's API, reusing a result from the last couple of seconds."""
     api_url = api_url.rstrip('/')
+    return await _ttl_cached(
+        _probe_cache, _probe_locks, api_url,
+        KIT_PROBE_CACHE_TTL_SECONDS, KIT_PROBE_CACHE_SIZE,
+        lambda: _probe_kit(api_url)
+    )
+
+
+async def _probe_kit(api_url: str) -> KitTestResult:
+    """Request a kit's /status and retrieve its kit_id."""
     start_time = time.time()
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{api_url}/status")
-            response_time = (time.time() - start_time) * 1000
-
-            if response.status_code == 200:
-                data = response.json()
-                kit_id = data.get('kit_id') or data.get('uid')
-                return KitTestResult(
-                    success=True,
-                    kit_id=kit_id,
-                    message=f"Successfully connected to kit",
-                    response_time_ms=round(response_time, 2)
-                )
-            else:
-                return KitTestResult(
-                    success=False,
-                    message=f"Kit returned HTTP {response.status_code}",
-                    response_time_ms=round(response_time, 2)
-                )
+        response = await _get_kit_http().get(f"{api_url}/status")
+        response_time = (time.time() - start_time) * 1000
+
+        if response.status_code == 200:
+            data = response.json()
+            kit_id = data.get('kit_id') or data.get('uid')
+            return KitTestResult(
+                success=True,
+                kit_id=kit_id,
+                message=f"Successfully connected to kit",
+                response_time_ms=round(response_time, 2)
+            )
+        else:
+            return KitTestResult(
+                success=False,
+                message=f"Kit returned HTTP {response.status_code}",
+                response_time_ms=round(response_time, 2)
+            )
     except httpx.TimeoutException:
         return KitTestResult(
             success=False,
@@ -585,15 +930,48 @@ async def _test_kit_connection(api_url: str) -> KitTestResult:
         )
 
 
+def _normalize_api_url(api_url: str) -> str:
+    """Strip trailing slashes and default to http:// when no scheme is given."""
+    api_url = api_url.rstrip('/')
+    if not api_url.startswith(('http://', 'https://')):
+        api_url = f"http://{api_url}"
+    return api_url
+
+
+def _valid_api_url(api_url: str) -> bool:
+    """Whether a (normalized) kit API URL is an http(s) URL with a host."""
+    return bool(_API_URL_RE.match(api_url))
+
+
+# Column order for _bulk_insert_kits records
+_KIT_BULK_COLUMNS = ("kit_id", "name", "api_url", "location", "status", "enabled")
+
+
+async def _bulk_insert_kits(rows: List[dict]) -> int:
+    """
+    Insert many kits with a single COPY instead of one INSERT per kit.
+
+    Each row needs the keys in _KIT_BULK_COLUMNS; created_at takes its default.
+    Returns the number of kits inserted.
+    """
+    if not rows:
+        return 0
+    records = [tuple(row[col] for col in _KIT_BULK_COLUMNS) for row in rows]
+    async with db_pool.acquire() as conn:
+        await conn.copy_records_to_table("kits", records=records, columns=list(_KIT_BULK_COLUMNS))
+    return len(records)
+
+
 def _generate_kit_id(api_url: str) -> str:
     """Generate a temporary kit_id from the API URL."""
-    # Extract host from URL
-    match = re.search(r'://([^:/]+)', api_url)
-    if match:
-        host = match.group(1)
+    # Extract host from URL (plain string splits; the separators are literals)
+    _, sep, rest = api_url.partition("://")
+    host = rest.split('/', 1)[0].split(':', 1)[0]
+    if sep and host:
         # Replace dots with dashes for cleaner ID
         return f"kit-{host.replace('.', '-')}"
-    return f"kit-{hash(api_url) % 10000}"
+    # Not hash(): that is salted per process, so the ID would change on restart
+    return f"kit-{hashlib.blake2b(api_url.encode(), digest_size=2).hexdigest()}"
 
 
 @app.post("/api/admin/kits", response_model=dict)
@@ -611,10 +989,9 @@ async def create_kit(request: Request, kit: KitCreate, user: str = Depends(requi
 
     await _ensure_enabled_column()
 
-    # Normalize URL
-    api_url = kit.api_url.rstrip('/')
-    if not api_url.startswith('http'):
-        api_url = f"http://{api_url}"
+    api_url = _normalize_api_url(kit.api_url)
+    if not _valid_api_url(api_url):
+        raise HTTPException(status_code=400, detail=f"Invalid API URL: {kit.api_url}")
 
     # Test connection to the kit
     test_result = await _test_kit_connection(api_url)
@@ -623,26 +1000,28 @@ async def create_kit(request: Request, kit: KitCreate, user: str = Depends(requi
     kit_id = test_result.kit_id or _generate_kit_id(api_url)
 
     try:
-        async with db_pool.acquire() as conn:
-            # Check if kit already exists
-            existing = await conn.fetchval(
+        # Insert unless the ID or URL is taken; only a conflict needs a second
+        # query, to name the existing kit
+        created = await db_pool.fetchval("""
+            INSERT INTO kits (kit_id, name, api_url, location, status, enabled, created_at)
+            SELECT $1, $2, $3, $4, $5, $6, NOW()
+            WHERE NOT EXISTS (SELECT 1 FROM kits WHERE api_url = $3)
+            ON CONFLICT (kit_id) DO NOTHING
+            RETURNING kit_id
+        """, kit_id, kit.name or kit_id, api_url, kit.location,
+            'online' if test_result.success else 'offline', kit.enabled)
+        if not created:
+            existing = await db_pool.fetchval(
                 "SELECT kit_id FROM kits WHERE kit_id = $1 OR api_url = $2",
                 kit_id, api_url
             )
-            if existing:
-                raise HTTPException(
-                    status_code=409,
-                    detail=f"Kit already exists with ID: {existing}"
-                )
-
-            # Insert the new kit
-            await conn.execute("""
-                INSERT INTO kits (kit_id, name, api_url, location, status, enabled, created_at)
-                VALUES ($1, $2, $3, $4, $5, $6, NOW())
-            """, kit_id, kit.name or kit_id, api_url, kit.location,
-                'online' if test_result.success else 'offline', kit.enabled)
+            raise HTTPException(
+                status_code=409,
+                detail=f"Kit already exists with ID: {existing or kit_id}"
+            )
 
         logger.info(f"Created new kit: {kit_id} ({api_url})")
+        _invalidate_kits_cache()
 
         # Audit log
         if AUDIT_AVAILABLE:
@@ -672,12 +1051,14 @@ async def create_kit(request: Request, kit: KitCreate, user: str = Depends(requi
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.put("/api/admin/kits/{kit_id}", response_model=dict)
-async def update_kit(request: Request, kit_id: str, kit: KitUpdate, user: str = Depends(require_auth)):
+@app.post("/api/admin/kits/bulk", response_model=dict)
+async def create_kits_bulk(request: Request, kits: List[KitCreate] = Body(...), user: str = Depends(require_auth)):
     """
-    Update an existing kit's configuration.
+    Add many kits at once (e.g. importing an existing deployment).
 
-    Only provided fields will be updated; null fields are ignored.
+    Kits are connection-tested concurrently and inserted with a single COPY.
+    Kits whose ID or URL is already registered (or repeated in the request)
+    are skipped rather than failing the whole import.
     """
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
@@ -686,53 +1067,127 @@ async def update_kit(request: Request, kit_id: str, kit: KitUpdate, user: str =
 
     await _ensure_enabled_column()
 
+    api_urls = [_normalize_api_url(kit.api_url) for kit in kits]
+    invalid = [kit.api_url for kit, url in zip(kits, api_urls) if not _valid_api_url(url)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid API URL: {', '.join(invalid)}")
+    test_results = await asyncio.gather(*[_test_kit_connection(url) for url in api_urls])
+    kit_ids = [result.kit_id or _generate_kit_id(url) for result, url in zip(test_results, api_urls)]
+
     try:
-        async with db_pool.acquire() as conn:
-            # Check if kit exists
-            existing = await conn.fetchrow(
-                "SELECT * FROM kits WHERE kit_id = $1", kit_id
+        existing = await db_pool.fetch(
+            "SELECT kit_id, api_url FROM kits WHERE kit_id = ANY($1) OR api_url = ANY($2)",
+            kit_ids, api_urls
+        )
+        taken_ids = {row["kit_id"] for row in existing}
+        taken_urls = {row["api_url"] for row in existing}
+
+        new_kits = []
+        skipped = []
+        for kit, api_url, kit_id, test_result in zip(kits, api_urls, kit_ids, test_results):
+            if kit_id in taken_ids or api_url in taken_urls:
+                skipped.append({"kit_id": kit_id, "api_url": api_url, "reason": "Kit already exists"})
+                continue
+            taken_ids.add(kit_id)
+            taken_urls.add(api_url)
+            new_kits.append({
+                "kit_id": kit_id,
+                "name": kit.name or kit_id,
+                "api_url": api_url,
+                "location": kit.location,
+                "status": 'online' if test_result.success else 'offline',
+                "enabled": kit.enabled,
+            })
+
+        created = await _bulk_insert_kits(new_kits)
+        logger.info(f"Bulk created {created} kits ({len(skipped)} skipped)")
+        _invalidate_kits_cache()
+
+        # Audit log
+        if AUDIT_AVAILABLE:
+            for new_kit in new_kits:
+                await audit_kit_action(
+                    AuditAction.KIT_CREATED, new_kit["kit_id"], user, success=True,
+                    details={"api_url": new_kit["api_url"], "name": new_kit["name"], "bulk": True},
+                    client_ip=client_ip
+                )
+
+        return {
+            "success": True,
+            "created": [new_kit["kit_id"] for new_kit in new_kits],
+            "skipped": skipped,
+            "message": f"Created {created} kits, skipped {len(skipped)}"
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to bulk create kits: {e}")
+        if AUDIT_AVAILABLE:
+            await audit_kit_action(
+                AuditAction.KIT_CREATED, "bulk", user, success=False,
+                details={"error": str(e), "count": len(kits)},
+                client_ip=client_ip
             )
-            if not existing:
-                raise HTTPException(status_code=404, detail=f"Kit not found: {kit_id}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-            # Build update query dynamically
-            updates = []
-            params = []
-            param_idx = 1
 
-            if kit.api_url is not None:
-                api_url = kit.api_url.rstrip('/')
-                if not api_url.startswith('http'):
-                    api_url = f"http://{api_url}"
-                updates.append(f"api_url = ${param_idx}")
-                params.append(api_url)
-                param_idx += 1
+@app.put("/api/admin/kits/{kit_id}", response_model=dict)
+async def update_kit(request: Request, kit_id: str, kit: KitUpdate, user: str = Depends(require_auth)):
+    """
+    Update an existing kit's configuration.
 
-            if kit.name is not None:
-                updates.append(f"name = ${param_idx}")
-                params.append(kit.name)
-                param_idx += 1
+    Only provided fields will be updated; null fields are ignored.
+    """
+    if not db_pool:
+        raise HTTPException(status_code=503, detail="Database unavailable")
 
-            if kit.location is not None:
-                updates.append(f"location = ${param_idx}")
-                params.append(kit.location)
-                param_idx += 1
+    client_ip = request.client.host if request.client else None
 
-            if kit.enabled is not None:
-                updates.append(f"enabled = ${param_idx}")
-                params.append(kit.enabled)
-                param_idx += 1
+    await _ensure_enabled_column()
 
-            if not updates:
-                return {"success": True, "message": "No changes requested", "kit_id": kit_id}
+    try:
+        # Build update query dynamically
+        updates = []
+        params = []
+        param_idx = 1
+
+        if kit.api_url is not None:
+            api_url = _normalize_api_url(kit.api_url)
+            if not _valid_api_url(api_url):
+                raise HTTPException(status_code=400, detail=f"Invalid API URL: {kit.api_url}")
+            updates.append(f"api_url = ${param_idx}")
+            params.append(api_url)
+            param_idx += 1
+
+        if kit.name is not None:
+            updates.append(f"name = ${param_idx}")
+            params.append(kit.name)
+            param_idx += 1
+
+        if kit.location is not None:
+            updates.append(f"location = ${param_idx}")
+            params.append(kit.location)
+            param_idx += 1
+
+        if kit.enabled is not None:
+            updates.append(f"enabled = ${param_idx}")
+            params.append(kit.enabled)
+            param_idx += 1
+
+        if not updates:
+            if not await db_pool.fetchval("SELECT 1 FROM kits WHERE kit_id = $1", kit_id):
+                raise HTTPException(status_code=404, detail=f"Kit not found: {kit_id}")
+            return {"success": True, "message": "No changes requested", "kit_id": kit_id}
 
-            # Add kit_id as last parameter
-            params.append(kit_id)
+        # Add kit_id as last parameter
+        params.append(kit_id)
 
-            query = f"UPDATE kits SET {', '.join(updates)} WHERE kit_id = ${param_idx}"
-            await conn.execute(query, *params)
+        # RETURNING doubles as the existence check: no row means no such kit
+        query = f"UPDATE kits SET {', '.join(updates)} WHERE kit_id = ${param_idx} RETURNING kit_id"
+        if not await db_pool.fetchval(query, *params):
+            raise HTTPException(status_code=404, detail=f"Kit not found: {kit_id}")
 
         logger.info(f"Updated kit: {kit_id}")
+        _invalidate_kits_cache()
 
         # Audit log
         if AUDIT_AVAILABLE:
@@ -757,6 +1212,19 @@ async def update_kit(request: Request, kit_id: str, kit: KitUpdate, user: str =
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Remove a kit and all of its drone, signal and health data in one round trip
+QUERY_DELETE_KIT_WITH_DATA = """
+    WITH k AS (DELETE FROM kits WHERE kit_id = $1 RETURNING 1),
+    d AS (DELETE FROM drones WHERE kit_id = $1 AND EXISTS (SELECT 1 FROM k) RETURNING 1),
+    s AS (DELETE FROM signals WHERE kit_id = $1 AND EXISTS (SELECT 1 FROM k) RETURNING 1),
+    h AS (DELETE FROM system_health WHERE kit_id = $1 AND EXISTS (SELECT 1 FROM k) RETURNING 1)
+    SELECT (SELECT count(*) FROM k) AS kits,
+           (SELECT count(*) FROM d) AS drones,
+           (SELECT count(*) FROM s) AS signals,
+           (SELECT count(*) FROM h) AS health_records
+"""
+
+
 @app.delete("/api/admin/kits/{kit_id}", response_model=dict)
 async def delete_kit(
     request: Request,
@@ -776,39 +1244,27 @@ async def delete_kit(
     client_ip = request.client.host if request.client else None
 
     try:
-        async with db_pool.acquire() as conn:
-            # Check if kit exists
-            existing = await conn.fetchval(
-                "SELECT kit_id FROM kits WHERE kit_id = $1", kit_id
-            )
-            if not existing:
+        # One statement either way; the kit delete doubles as the existence
+        # check, and data is only removed if the kit row was
+        deleted_data = {}
+        if delete_data:
+            async with db_pool.acquire() as conn:
+                async with conn.transaction():
+                    # A kit's full history can take longer than the per-query limit
+                    await conn.execute("SET LOCAL statement_timeout = 0")
+                    row = await conn.fetchrow(QUERY_DELETE_KIT_WITH_DATA, kit_id)
+            if not row["kits"]:
                 raise HTTPException(status_code=404, detail=f"Kit not found: {kit_id}")
-
-            # Optionally delete associated data
-            deleted_data = {}
-            if delete_data:
-                # Delete from drones table
-                drone_result = await conn.execute(
-                    "DELETE FROM drones WHERE kit_id = $1", kit_id
-                )
-                deleted_data['drones'] = int(drone_result.split()[-1]) if drone_result else 0
-
-                # Delete from signals table
-                signal_result = await conn.execute(
-                    "DELETE FROM signals WHERE kit_id = $1", kit_id
-                )
-                deleted_data['signals'] = int(signal_result.split()[-1]) if signal_result else 0
-
-                # Delete from system_health table
-                health_result = await conn.execute(
-                    "DELETE FROM system_health WHERE kit_id = $1", kit_id
-                )
-                deleted_data['health_records'] = int(health_result.split()[-1]) if health_result else 0
-
-            # Delete the kit
-            await conn.execute("DELETE FROM kits WHERE kit_id = $1", kit_id)
+            deleted_data = {
+                "drones": row["drones"],
+                "signals": row["signals"],
+                "health_records": row["health_records"],
+            }
+        elif not await db_pool.fetchval("DELETE FROM kits WHERE kit_id = $1 RETURNING kit_id", kit_id):
+            raise HTTPException(status_code=404, detail=f"Kit not found: {kit_id}")
 
         logger.info(f"Deleted kit: {kit_id} (delete_data={delete_data})")
+        _invalidate_kits_cache()
 
         # Audit log
         if AUDIT_AVAILABLE:
@@ -848,12 +1304,11 @@ async def test_kit_connection(api_url: str = Query(..., description="API URL to
 
     Useful for verifying the URL before adding a new kit.
     """
-    # Normalize URL
-    api_url = api_url.rstrip('/')
-    if not api_url.startswith('http'):
-        api_url = f"http://{api_url}"
+    normalized = _normalize_api_url(api_url)
+    if not _valid_api_url(normalized):
+        raise HTTPException(status_code=400, detail=f"Invalid API URL: {api_url}")
 
-    return await _test_kit_connection(api_url)
+    return await _test_kit_connection(normalized)
 
 
 @app.post("/api/admin/kits/{kit_id}/test", response_model=KitTestResult)
@@ -864,33 +1319,35 @@ async def test_existing_kit(kit_id: str):
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
 
-    async with db_pool.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT api_url FROM kits WHERE kit_id = $1", kit_id
-        )
-        if not row:
-            raise HTTPException(status_code=404, detail=f"Kit not found: {kit_id}")
+    row = await db_pool.fetchrow(
+        "SELECT api_url FROM kits WHERE kit_id = $1", kit_id
+    )
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Kit not found: {kit_id}")
 
     return await _test_kit_connection(row['api_url'])
 
 
 @app.get("/api/admin/kits/reload-status")
-async def get_reload_status():
+async def get_reload_status(
+    probe: bool = Query(False, description="Also test each kit's API connection now")
+):
     """
     Check the status of kit configuration reload.
 
     Returns information about which kits are configured and their polling status.
+    With probe=true, every kit with an API URL is connection-tested concurrently
+    and the result is attached as connection_test (null for MQTT-only kits).
     """
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
 
     try:
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT kit_id, name, api_url, status, enabled, last_seen
-                FROM kits
-                ORDER BY name
-            """)
+        rows = await db_pool.fetch("""
+            SELECT kit_id, name, api_url, status, enabled, last_seen
+            FROM kits
+            ORDER BY name
+        """)
 
         kits = []
         for row in rows:
@@ -898,6 +1355,19 @@ async def get_reload_status():
             kit['enabled'] = kit.get('enabled', True)
             kits.append(kit)
 
+        if probe:
+            probed = [kit for kit in kits if kit['api_url']]
+            results = await asyncio.gather(
+                *[_test_kit_connection(kit['api_url']) for kit in probed],
+                return_exceptions=True
+            )
+            for kit in kits:
+                kit['connection_test'] = None
+            for kit, result in zip(probed, results):
+                if isinstance(result, Exception):
+                    result = KitTestResult(success=False, message=f"Connection failed: {result}")
+                kit['connection_test'] = result.dict()
+
         return {
             "total_kits": len(kits),
             "enabled_kits": sum(1 for k in kits if k.get('enabled', True)),
@@ -909,8 +1379,110 @@ async def get_reload_status():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Filter SQL is cached per combination of filters present: the text only
+# depends on which filters are set, so each combination is built once and
+# asyncpg's per-connection statement cache keeps hitting the same statement.
+# Optional filters bind after the $1/$2 time range, in tuple order.
+_DRONE_FILTERS = ("kit_id = ANY(${})", "rid_make = ${}", "track_type = ${}", "transport = ${}")
+_SIGNAL_FILTERS = ("kit_id = ANY(${})", "detection_type = ${}")
+
+
+def _filter_sql(filters: tuple, present: tuple) -> tuple[str, int]:
+    """Return the WHERE clause for the present filters and the next placeholder number."""
+    clauses = ["time >= $1 AND time <= $2"]
+    param = 3
+    for template, on in zip(filters, present):
+        if on:
+            clauses.append(template.format(param))
+            param += 1
+    return " AND ".join(clauses), param
+
+
+@lru_cache(maxsize=None)
+def _drone_queries(present: tuple, deduplicate: bool) -> tuple[str, str]:
+    """Return the /api/drones row query (limit is the last param) and its count query."""
+    where_clause, limit_param = _filter_sql(_DRONE_FILTERS, present)
+
+    # v2 extended fields: description / freq_mhz / rid_status / etc. are
+    # added by timescaledb/07-extended-fields-v2.sql and populated by
+    # mqtt_ingest.insert_drone(). They're explicit in the SELECT so the
+    # frontend (map popups, dashboards) sees them in the JSON response.
+    if deduplicate:
+        # Return only the latest detection per drone_id
+        # This prevents showing the same drone 13 times
+        # (ordered by idx_drones_drone_id, so no sort is needed)
+        query = f"""
+            SELECT DISTINCT ON (drone_id)
+                time, kit_id, drone_id, lat, lon, alt, speed, heading,
+                pilot_lat, pilot_lon, home_lat, home_lon, mac, rssi, freq,
+                ua_type, operator_id, caa_id, rid_make, rid_model, rid_source, track_type, transport,
+                description, freq_mhz, rid_status, rid_tracking,
+                rid_lookup_attempted, rid_lookup_success, ua_type_name
+            FROM drones
+            WHERE {where_clause}
+            ORDER BY drone_id, time DESC
+            LIMIT ${limit_param}
+        """
+    else:
+        # Return all raw detections (original behavior)
+        query = f"""
+            SELECT
+                time, kit_id, drone_id, lat, lon, alt, speed, heading,
+                pilot_lat, pilot_lon, home_lat, home_lon, mac, rssi, freq,
+                ua_type, operator_id, caa_id, rid_make, rid_model, rid_source, track_type, transport,
+                description, freq_mhz, rid_status, rid_tracking,
+                rid_lookup_attempted, rid_lookup_success, ua_type_name
+            FROM drones
+            WHERE {where_clause}
+            ORDER BY time DESC
+            LIMIT ${limit_param}
+        """
+
+    # Also get total detection count for the time range
+    count_query = f"""
+        SELECT
+            COUNT(*) AS total_detections,
+            COUNT(DISTINCT drone_id) AS unique_drones
+        FROM drones
+        WHERE {where_clause}
+    """
+    return query, count_query
+
+
+@lru_cache(maxsize=None)
+def _signals_query(present: tuple) -> str:
+    """Return the /api/signals query (limit is the last param)."""
+    where_clause, limit_param = _filter_sql(_SIGNAL_FILTERS, present)
+    return f"""
+        SELECT
+            time, kit_id, freq_mhz, power_dbm, bandwidth_mhz,
+            lat, lon, alt, detection_type,
+            pal_conf, ntsc_conf, source, signal_type
+        FROM signals
+        WHERE {where_clause}
+        ORDER BY time DESC
+        LIMIT ${limit_param}
+    """
+
+
+@lru_cache(maxsize=None)
+def _export_query(present: tuple) -> str:
+    """Return the CSV export query for the kit/make/type filters present."""
+    where_clause, _ = _filter_sql(_DRONE_FILTERS[:3], present)
+    return f"""
+        SELECT
+            time, kit_id, drone_id, lat, lon, alt, speed, heading,
+            pilot_lat, pilot_lon, home_lat, home_lon, mac, rssi, freq,
+            ua_type, operator_id, caa_id, rid_make, rid_model, rid_source, track_type
+        FROM drones
+        WHERE {where_clause}
+        ORDER BY time DESC
+    """
+
+
 @app.get("/api/drones")
 async def query_drones(
+    request: Request,
     time_range: str = Query("1h", description="Time range: 1h, 24h, 7d, or custom:START,END"),
     kit_id: Optional[str] = Query(None, description="Filter by kit ID (comma-separated for multiple)"),
     rid_make: Optional[str] = Query(None, description="Filter by RID make (e.g., DJI, Autel)"),
@@ -931,6 +1503,9 @@ async def query_drones(
         - drones: List of track records (deduplicated by default)
         - count: Number of unique drones
         - total_detections: Total number of raw detections in time range
+
+        With `Accept: application/x-ndjson`, the track records are streamed
+        one per line instead, without the counts.
     """
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
@@ -938,97 +1513,33 @@ async def query_drones(
     try:
         start_time, end_time = parse_time_range(time_range)
 
-        # Build base WHERE clause
-        where_clauses = ["time >= $1 AND time <= $2"]
-        params = [start_time, end_time]
-        param_counter = 3
-
-        # Add kit_id filter
-        if kit_id:
-            kit_ids = [k.strip() for k in kit_id.split(",")]
-            where_clauses.append(f"kit_id = ANY(${param_counter})")
-            params.append(kit_ids)
-            param_counter += 1
-
-        # Add rid_make filter
-        if rid_make:
-            where_clauses.append(f"rid_make = ${param_counter}")
-            params.append(rid_make)
-            param_counter += 1
-
-        # Add track_type filter
-        if track_type:
-            where_clauses.append(f"track_type = ${param_counter}")
-            params.append(track_type)
-            param_counter += 1
-
-        if transport:
-            where_clauses.append(f"transport = ${param_counter}")
-            params.append(transport)
-            param_counter += 1
-
-        where_clause = " AND ".join(where_clauses)
-
-        # v2 extended fields: description / freq_mhz / rid_status / etc. are
-        # added by timescaledb/07-extended-fields-v2.sql and populated by
-        # mqtt_ingest.insert_drone(). They're explicit in the SELECT so the
-        # frontend (map popups, dashboards) sees them in the JSON response.
-        if deduplicate:
-            # Return only the latest detection per drone_id
-            # This prevents showing the same drone 13 times
-            query = f"""
-                SELECT DISTINCT ON (drone_id)
-                    time, kit_id, drone_id, lat, lon, alt, speed, heading,
-                    pilot_lat, pilot_lon, home_lat, home_lon, mac, rssi, freq,
-                    ua_type, operator_id, caa_id, rid_make, rid_model, rid_source, track_type, transport,
-                    description, freq_mhz, rid_status, rid_tracking,
-                    rid_lookup_attempted, rid_lookup_success, ua_type_name
-                FROM drones
-                WHERE {where_clause}
-                ORDER BY drone_id, time DESC
-                LIMIT ${param_counter}
-            """
-        else:
-            # Return all raw detections (original behavior)
-            query = f"""
-                SELECT
-                    time, kit_id, drone_id, lat, lon, alt, speed, heading,
-                    pilot_lat, pilot_lon, home_lat, home_lon, mac, rssi, freq,
-                    ua_type, operator_id, caa_id, rid_make, rid_model, rid_source, track_type, transport,
-                    description, freq_mhz, rid_status, rid_tracking,
-                    rid_lookup_attempted, rid_lookup_success, ua_type_name
-                FROM drones
-                WHERE {where_clause}
-                ORDER BY time DESC
-                LIMIT ${param_counter}
-            """
+        # Optional filters bind after the time range in _DRONE_FILTERS order
+        kit_ids = [k.strip() for k in kit_id.split(",")] if kit_id else None
+        filters = (kit_ids, rid_make, track_type, transport)
+        params = [start_time, end_time] + [value for value in filters if value]
+        query, count_query = _drone_queries(tuple(bool(value) for value in filters), deduplicate)
         params.append(limit)
 
-        # Also get total detection count for the time range
-        count_query = f"""
-            SELECT
-                COUNT(*) AS total_detections,
-                COUNT(DISTINCT drone_id) AS unique_drones
-            FROM drones
-            WHERE {where_clause}
-        """
-        count_params = params[:-1]  # Exclude limit
+        if _wants_ndjson(request):
+            return await _ndjson_response(query, params)
 
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-            count_row = await conn.fetchrow(count_query, *count_params)
+        count_params = params[:-1]  # Exclude limit
 
-        drones = [dict(row) for row in rows]
+        # Rows and counts run at once on two pooled connections
+        rows, count_row = await asyncio.gather(
+            db_pool.fetch(query, *params),
+            db_pool.fetchrow(count_query, *count_params),
+        )
 
-        return {
-            "drones": drones,
+        return _raw_json({
+            "drones": rows,
             "count": count_row['unique_drones'],  # Number of unique drones
             "total_detections": count_row['total_detections'],  # Total raw detections
             "time_range": {
                 "start": start_time.isoformat(),
                 "end": end_time.isoformat()
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query drones: {e}")
@@ -1037,6 +1548,7 @@ async def query_drones(
 
 @app.get("/api/drones/{drone_id}/track")
 async def get_drone_track(
+    request: Request,
     drone_id: str,
     time_range: str = Query("1h", description="Time range: 1h, 24h, 7d, or custom:START,END"),
     limit: int = Query(500, description="Maximum number of track points", le=2000)
@@ -1051,6 +1563,9 @@ async def get_drone_track(
         - track: List of position records with time, lat, lon, alt, speed
         - drone_id: The requested drone ID
         - point_count: Number of track points returned
+
+        With `Accept: application/x-ndjson`, the track points are streamed
+        one per line instead.
     """
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
@@ -1069,20 +1584,21 @@ async def get_drone_track(
             LIMIT $4
         """
 
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, drone_id, start_time, end_time, limit)
+        params = [drone_id, start_time, end_time, limit]
+        if _wants_ndjson(request):
+            return await _ndjson_response(query, params)
 
-        track = [dict(row) for row in rows]
+        rows = await db_pool.fetch(query, *params)
 
-        return {
+        return _raw_json({
             "drone_id": drone_id,
-            "track": track,
-            "point_count": len(track),
+            "track": rows,
+            "point_count": len(rows),
             "time_range": {
                 "start": start_time.isoformat(),
                 "end": end_time.isoformat()
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to get drone track for {drone_id}: {e}")
@@ -1091,6 +1607,7 @@ async def get_drone_track(
 
 @app.get("/api/signals")
 async def query_signals(
+    request: Request,
     time_range: str = Query("1h", description="Time range: 1h, 24h, 7d, or custom:START,END"),
     kit_id: Optional[str] = Query(None, description="Filter by kit ID (comma-separated for multiple)"),
     detection_type: Optional[str] = Query(None, description="Filter by detection type: analog or dji"),
@@ -1101,6 +1618,9 @@ async def query_signals(
 
     Returns:
         List of signal detections matching the filter criteria.
+
+        With `Accept: application/x-ndjson`, the detections are streamed
+        one per line instead.
     """
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
@@ -1108,53 +1628,61 @@ async def query_signals(
     try:
         start_time, end_time = parse_time_range(time_range)
 
-        # Build query
-        query = """
-            SELECT
-                time, kit_id, freq_mhz, power_dbm, bandwidth_mhz,
-                lat, lon, alt, detection_type,
-                pal_conf, ntsc_conf, source, signal_type
-            FROM signals
-            WHERE time >= $1 AND time <= $2
-        """
-        params = [start_time, end_time]
-        param_counter = 3
-
-        # Add kit_id filter
-        if kit_id:
-            kit_ids = [k.strip() for k in kit_id.split(",")]
-            query += f" AND kit_id = ANY(${param_counter})"
-            params.append(kit_ids)
-            param_counter += 1
-
-        # Add detection_type filter
-        if detection_type:
-            query += f" AND detection_type = ${param_counter}"
-            params.append(detection_type)
-            param_counter += 1
-
-        query += f" ORDER BY time DESC LIMIT ${param_counter}"
+        kit_ids = [k.strip() for k in kit_id.split(",")] if kit_id else None
+        filters = (kit_ids, detection_type)
+        params = [start_time, end_time] + [value for value in filters if value]
+        query = _signals_query(tuple(bool(value) for value in filters))
         params.append(limit)
 
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
+        if _wants_ndjson(request):
+            return await _ndjson_response(query, params)
 
-        signals = [dict(row) for row in rows]
+        rows = await db_pool.fetch(query, *params)
 
-        return {
-            "signals": signals,
-            "count": len(signals),
+        return _raw_json({
+            "signals": rows,
+            "count": len(rows),
             "time_range": {
                 "start": start_time.isoformat(),
                 "end": end_time.isoformat()
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query signals: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Chunks buffered between Postgres and a slow download before COPY waits
+_CSV_COPY_QUEUE_CHUNKS = 16
+
+
+async def _copy_csv(query: str, params: list, output) -> int:
+    """Run COPY (query) TO STDOUT as CSV, passing each chunk to output; returns row count."""
+    async with db_pool.acquire() as conn:
+        async with conn.transaction():
+            # Timestamps are written in the session time zone
+            await conn.execute("SET LOCAL TIME ZONE 'UTC'")
+            # A large export to a slow client can outlive the per-query limit
+            await conn.execute("SET LOCAL statement_timeout = 0")
+            status = await conn.copy_from_query(
+                query, *params, output=output, format="csv", header=True
+            )
+    return int(status.split()[-1])
+
+
+async def _next_copy_chunk(chunks: asyncio.Queue, copy_task: asyncio.Task) -> Optional[bytes]:
+    """Next chunk from a running _copy_csv; None once it has finished, re-raising its error."""
+    while not (copy_task.done() and chunks.empty()):
+        getter = asyncio.ensure_future(chunks.get())
+        done, _ = await asyncio.wait({getter, copy_task}, return_when=asyncio.FIRST_COMPLETED)
+        if getter in done:
+            return getter.result()
+        getter.cancel()
+    copy_task.result()
+    return None
+
+
 @app.get("/api/export/csv")
 async def export_csv(
     request: Request,
@@ -1178,66 +1706,52 @@ async def export_csv(
     try:
         start_time, end_time = parse_time_range(time_range)
 
-        # Build query (same as /api/drones but without limit)
-        query = """
-            SELECT
-                time, kit_id, drone_id, lat, lon, alt, speed, heading,
-                pilot_lat, pilot_lon, home_lat, home_lon, mac, rssi, freq,
-                ua_type, operator_id, caa_id, rid_make, rid_model, rid_source, track_type
-            FROM drones
-            WHERE time >= $1 AND time <= $2
-        """
-        params = [start_time, end_time]
-        param_counter = 3
-
-        if kit_id:
-            kit_ids = [k.strip() for k in kit_id.split(",")]
-            query += f" AND kit_id = ANY(${param_counter})"
-            params.append(kit_ids)
-            param_counter += 1
-
-        if rid_make:
-            query += f" AND rid_make = ${param_counter}"
-            params.append(rid_make)
-            param_counter += 1
-
-        if track_type:
-            query += f" AND track_type = ${param_counter}"
-            params.append(track_type)
-            param_counter += 1
-
-        query += " ORDER BY time DESC"
-
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-
-        # Generate CSV
-        output = io.StringIO()
-        if rows:
-            writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(dict(row))
-
-        csv_content = output.getvalue()
-        output.close()
+        # Same filters as /api/drones (minus transport), without a limit
+        kit_ids = [k.strip() for k in kit_id.split(",")] if kit_id else None
+        filters = (kit_ids, rid_make, track_type)
+        params = [start_time, end_time] + [value for value in filters if value]
+        query = _export_query(tuple(bool(value) for value in filters))
+
+        # Postgres writes the CSV itself; wait for the first chunk (the header)
+        # so query errors still surface as a 500 before streaming starts
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=_CSV_COPY_QUEUE_CHUNKS)
+        copy_task = asyncio.create_task(
+            _copy_csv(query, params, lambda data: chunks.put(bytes(data)))
+        )
+        try:
+            first_chunk = await _next_copy_chunk(chunks, copy_task)
+        except BaseException:
+            copy_task.cancel()
+            raise
 
         # Return as downloadable file
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
         filename = f"wardragon_drones_{timestamp}.csv"
 
-        # Audit log export
-        if AUDIT_AVAILABLE:
-            await audit_data_export(
-                user=user,
-                export_type="csv",
-                record_count=len(rows),
-                filters={"time_range": time_range, "kit_id": kit_id, "rid_make": rid_make, "track_type": track_type},
-                client_ip=client_ip
-            )
+        async def stream_csv():
+            try:
+                chunk = first_chunk
+                while chunk is not None:
+                    yield chunk
+                    chunk = await _next_copy_chunk(chunks, copy_task)
+            finally:
+                copy_task.cancel()
+
+            record_count = copy_task.result()
+            logger.info(f"CSV export by {user}: {record_count} rows ({time_range})")
+
+            # Audit log export
+            if AUDIT_AVAILABLE:
+                await audit_data_export(
+                    user=user,
+                    export_type="csv",
+                    record_count=record_count,
+                    filters={"time_range": time_range, "kit_id": kit_id, "rid_make": rid_make, "track_type": track_type},
+                    client_ip=client_ip
+                )
 
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            stream_csv(),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -1262,60 +1776,40 @@ async def get_repeated_drones(
         raise HTTPException(status_code=503, detail="Database unavailable")
 
     try:
+        # One pass over the window: counts and the location trail come out of
+        # the same GROUP BY
         query = """
-            WITH recent_drones AS (
-                SELECT
-                    drone_id,
-                    time,
-                    kit_id,
-                    lat,
-                    lon
-                FROM drones
-                WHERE time >= NOW() - make_interval(hours => $1)
-                    AND lat IS NOT NULL
-                    AND lon IS NOT NULL
-            ),
-            drone_counts AS (
-                SELECT
-                    drone_id,
-                    COUNT(*) AS appearance_count,
-                    MIN(time) AS first_seen,
-                    MAX(time) AS last_seen
-                FROM recent_drones
-                GROUP BY drone_id
-                HAVING COUNT(*) >= $2
-            )
             SELECT
-                dc.drone_id,
-                dc.first_seen,
-                dc.last_seen,
-                dc.appearance_count,
+                drone_id,
+                MIN(time) AS first_seen,
+                MAX(time) AS last_seen,
+                COUNT(*) AS appearance_count,
                 json_agg(
                     json_build_object(
-                        'lat', rd.lat,
-                        'lon', rd.lon,
-                        'kit_id', rd.kit_id,
-                        'timestamp', rd.time
-                    ) ORDER BY rd.time
+                        'lat', lat,
+                        'lon', lon,
+                        'kit_id', kit_id,
+                        'timestamp', time
+                    ) ORDER BY time
                 ) AS locations
-            FROM drone_counts dc
-            JOIN recent_drones rd ON dc.drone_id = rd.drone_id
-            GROUP BY dc.drone_id, dc.first_seen, dc.last_seen, dc.appearance_count
-            ORDER BY dc.appearance_count DESC, dc.last_seen DESC
+            FROM drones
+            WHERE time >= NOW() - make_interval(hours => $1)
+                AND lat IS NOT NULL
+                AND lon IS NOT NULL
+            GROUP BY drone_id
+            HAVING COUNT(*) >= $2
+            ORDER BY appearance_count DESC, last_seen DESC
             LIMIT 100
         """
 
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, time_window_hours, min_appearances)
-
-        results = [dict(row) for row in rows]
+        rows = await db_pool.fetch(query, time_window_hours, min_appearances)
 
-        return {
-            "repeated_drones": results,
-            "count": len(results),
+        return _raw_json({
+            "repeated_drones": rows,
+            "count": len(rows),
             "time_window_hours": time_window_hours,
             "min_appearances": min_appearances
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query repeated drones: {e}")
@@ -1340,19 +1834,19 @@ async def get_coordinated_drones(
         # Use the database function for coordinated activity detection
         query = "SELECT detect_coordinated_activity($1, $2) AS groups"
 
-        async with db_pool.acquire() as conn:
-            result = await conn.fetchval(query, time_window_minutes, distance_threshold_m)
+        result = await db_pool.fetchval(query, time_window_minutes, distance_threshold_m)
 
-        # Parse JSON result
-        import json
-        groups = json.loads(result) if result else []
+        # Pool connections decode json already; parse if handed raw text
+        if isinstance(result, str):
+            result = _decode_json(result)
+        groups = result or []
 
-        return {
+        return _raw_json({
             "coordinated_groups": groups,
             "count": len(groups),
             "time_window_minutes": time_window_minutes,
             "distance_threshold_m": distance_threshold_m
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to detect coordinated activity: {e}")
@@ -1362,7 +1856,9 @@ async def get_coordinated_drones(
 @app.get("/api/patterns/pilot-reuse")
 async def get_pilot_reuse(
     time_window_hours: int = Query(24, description="Time window in hours", ge=1, le=168),
-    proximity_threshold_m: float = Query(50, description="Proximity threshold in meters", ge=10)
+    proximity_threshold_m: float = Query(50, description="Proximity threshold in meters", ge=10),
+    limit: int = Query(100, description="Maximum groups to return", ge=1, le=1000),
+    offset: int = Query(0, description="Groups to skip, for paging", ge=0)
 ):
     """
     Find potential operator reuse across different drone IDs.
@@ -1372,14 +1868,18 @@ async def get_pilot_reuse(
     2. Pilot locations within proximity threshold
 
     Returns:
-        List of operators/locations with associated drones.
+        A page of operators/locations with their most recent drone sightings
+        (up to 50 per group; drone_count covers all of them).
     """
     if not db_pool:
         raise HTTPException(status_code=503, detail="Database unavailable")
 
     try:
-        # Method 1: Exact operator_id matches
-        operator_query = """
+        # Both methods in one statement over a single scan of recent drones;
+        # operator_id matches are listed first, then proximity clusters. Each
+        # group lists only its 50 most recent sightings so one busy operator
+        # can't dominate the response.
+        query = """
             WITH recent_drones AS (
                 SELECT
                     drone_id,
@@ -1389,37 +1889,37 @@ async def get_pilot_reuse(
                     pilot_lon
                 FROM drones
                 WHERE time >= NOW() - make_interval(hours => $1)
-                    AND operator_id IS NOT NULL
-            )
-            SELECT
-                operator_id AS pilot_identifier,
-                'operator_id' AS correlation_method,
-                json_agg(
-                    json_build_object(
-                        'drone_id', drone_id,
-                        'timestamp', time,
-                        'pilot_lat', pilot_lat,
-                        'pilot_lon', pilot_lon
-                    ) ORDER BY time DESC
-                ) AS drones,
-                COUNT(DISTINCT drone_id) AS drone_count
-            FROM recent_drones
-            GROUP BY operator_id
-            HAVING COUNT(DISTINCT drone_id) >= 2
-            ORDER BY drone_count DESC
-        """
-
-        # Method 2: Proximity-based clustering
-        proximity_query = """
-            WITH recent_pilots AS (
+                    AND (operator_id IS NOT NULL
+                         OR (pilot_lat IS NOT NULL AND pilot_lon IS NOT NULL))
+            ),
+            -- Method 1: Exact operator_id matches
+            operator_matches AS (
+                SELECT
+                    operator_id AS pilot_identifier,
+                    'operator_id' AS correlation_method,
+                    array_to_json((array_agg(
+                        json_build_object(
+                            'drone_id', drone_id,
+                            'timestamp', time,
+                            'pilot_lat', pilot_lat,
+                            'pilot_lon', pilot_lon
+                        ) ORDER BY time DESC
+                    ))[1:50]) AS drones,
+                    COUNT(DISTINCT drone_id) AS drone_count
+                FROM recent_drones
+                WHERE operator_id IS NOT NULL
+                GROUP BY operator_id
+                HAVING COUNT(DISTINCT drone_id) >= 2
+            ),
+            -- Method 2: Proximity-based clustering
+            recent_pilots AS (
                 SELECT DISTINCT ON (drone_id)
                     drone_id,
                     pilot_lat,
                     pilot_lon,
                     time
-                FROM drones
-                WHERE time >= NOW() - make_interval(hours => $1)
-                    AND pilot_lat IS NOT NULL
+                FROM recent_drones
+                WHERE pilot_lat IS NOT NULL
                     AND pilot_lon IS NOT NULL
                     AND operator_id IS NULL
                 ORDER BY drone_id, time DESC
@@ -1427,46 +1927,69 @@ async def get_pilot_reuse(
             pilot_pairs AS (
                 SELECT
                     p1.drone_id AS drone1_id,
-                    p2.drone_id AS drone2_id,
                     p1.pilot_lat AS pilot1_lat,
                     p1.pilot_lon AS pilot1_lon,
-                    calculate_distance_m(p1.pilot_lat, p1.pilot_lon, p2.pilot_lat, p2.pilot_lon) AS distance_m
+                    p1.time AS time1,
+                    p2.drone_id AS drone2_id,
+                    p2.pilot_lat AS pilot2_lat,
+                    p2.pilot_lon AS pilot2_lon,
+                    p2.time AS time2
                 FROM recent_pilots p1
-                CROSS JOIN recent_pilots p2
-                WHERE p1.drone_id < p2.drone_id
-                    AND calculate_distance_m(p1.pilot_lat, p1.pilot_lon, p2.pilot_lat, p2.pilot_lon) <= $2
+                JOIN recent_pilots p2
+                    ON p1.drone_id < p2.drone_id
+                    -- Cheap latitude band first: the haversine distance is never
+                    -- less than the north-south separation, so pairs outside it
+                    -- can't match and skip the distance function entirely
+                    AND abs(p2.pilot_lat - p1.pilot_lat) <= degrees($2 / 6371000.0)
+                WHERE calculate_distance_m(p1.pilot_lat, p1.pilot_lon, p2.pilot_lat, p2.pilot_lon) <= $2
+            ),
+            -- Each cluster is a drone plus every later-ID drone within range,
+            -- listed once each; the pairs carry the pilot columns, so members
+            -- are unpivoted from them without going back to recent_pilots
+            cluster_members AS (
+                SELECT drone1_id AS anchor_id, drone1_id AS drone_id,
+                       pilot1_lat AS pilot_lat, pilot1_lon AS pilot_lon, time1 AS time
+                FROM pilot_pairs
+                UNION
+                SELECT drone1_id, drone2_id, pilot2_lat, pilot2_lon, time2
+                FROM pilot_pairs
+            ),
+            proximity_matches AS (
+                SELECT
+                    CONCAT('PILOT_', ROUND(AVG(pilot_lat)::numeric, 4), '_', ROUND(AVG(pilot_lon)::numeric, 4)) AS pilot_identifier,
+                    'proximity' AS correlation_method,
+                    array_to_json((array_agg(
+                        json_build_object(
+                            'drone_id', drone_id,
+                            'timestamp', time,
+                            'pilot_lat', pilot_lat,
+                            'pilot_lon', pilot_lon
+                        ) ORDER BY time DESC
+                    ))[1:50]) AS drones,
+                    COUNT(*) AS drone_count
+                FROM cluster_members
+                GROUP BY anchor_id
             )
-            SELECT
-                CONCAT('PILOT_', ROUND(AVG(rp.pilot_lat)::numeric, 4), '_', ROUND(AVG(rp.pilot_lon)::numeric, 4)) AS pilot_identifier,
-                'proximity' AS correlation_method,
-                json_agg(
-                    json_build_object(
-                        'drone_id', rp.drone_id,
-                        'timestamp', rp.time,
-                        'pilot_lat', rp.pilot_lat,
-                        'pilot_lon', rp.pilot_lon
-                    ) ORDER BY rp.time DESC
-                ) AS drones,
-                COUNT(DISTINCT rp.drone_id) AS drone_count
-            FROM pilot_pairs pp
-            JOIN recent_pilots rp ON rp.drone_id = pp.drone1_id OR rp.drone_id = pp.drone2_id
-            GROUP BY pp.drone1_id
-            HAVING COUNT(DISTINCT rp.drone_id) >= 2
-            ORDER BY drone_count DESC
+            SELECT pilot_identifier, correlation_method, drones, drone_count
+            FROM (
+                SELECT *, 0 AS method_order FROM operator_matches
+                UNION ALL
+                SELECT *, 1 AS method_order FROM proximity_matches
+            ) matches
+            ORDER BY method_order, drone_count DESC, pilot_identifier
+            LIMIT $3 OFFSET $4
         """
 
-        async with db_pool.acquire() as conn:
-            operator_rows = await conn.fetch(operator_query, time_window_hours)
-            proximity_rows = await conn.fetch(proximity_query, time_window_hours, proximity_threshold_m)
-
-        results = [dict(row) for row in operator_rows] + [dict(row) for row in proximity_rows]
+        rows = await db_pool.fetch(query, time_window_hours, proximity_threshold_m, limit, offset)
 
-        return {
-            "pilot_reuse": results,
-            "count": len(results),
+        return _raw_json({
+            "pilot_reuse": rows,
+            "count": len(rows),
             "time_window_hours": time_window_hours,
-            "proximity_threshold_m": proximity_threshold_m
-        }
+            "proximity_threshold_m": proximity_threshold_m,
+            "limit": limit,
+            "offset": offset
+        })
 
     except Exception as e:
         logger.error(f"Failed to detect pilot reuse: {e}")
@@ -1506,21 +2029,21 @@ async def get_anomalies(
                     heading,
                     track_type,
                     rid_make,
-                    rid_model,
-                    LAG(alt) OVER (PARTITION BY drone_id ORDER BY time) AS prev_alt,
-                    LAG(time) OVER (PARTITION BY drone_id ORDER BY time) AS prev_time
+                    rid_model
                 FROM drones
                 WHERE time >= NOW() - make_interval(hours => $1)
                     AND track_type = 'drone'
             ),
+            -- Speed and altitude read drones directly, so their filters can use
+            -- the partial anomaly indexes
             speed_anomalies AS (
                 SELECT
                     'speed' AS anomaly_type,
                     CASE
-                        WHEN speed > 50 THEN 'critical'
-                        WHEN speed > 40 THEN 'high'
-                        ELSE 'medium'
-                    END AS severity,
+                        WHEN speed > 50 THEN 2
+                        WHEN speed > 40 THEN 1
+                        ELSE 0
+                    END AS severity_level,
                     drone_id,
                     json_build_object(
                         'speed_ms', speed,
@@ -1530,17 +2053,21 @@ async def get_anomalies(
                         'rid_make', rid_make
                     ) AS details,
                     time AS timestamp
-                FROM recent_drones
-                WHERE speed > 30
+                FROM drones
+                WHERE time >= NOW() - make_interval(hours => $1)
+                    AND track_type = 'drone'
+                    AND speed > 30
+                ORDER BY timestamp DESC, severity_level DESC
+                LIMIT 200
             ),
             altitude_anomalies AS (
                 SELECT
                     'altitude' AS anomaly_type,
                     CASE
-                        WHEN alt > 500 THEN 'critical'
-                        WHEN alt > 450 THEN 'high'
-                        ELSE 'medium'
-                    END AS severity,
+                        WHEN alt > 500 THEN 2
+                        WHEN alt > 450 THEN 1
+                        ELSE 0
+                    END AS severity_level,
                     drone_id,
                     json_build_object(
                         'altitude_m', alt,
@@ -1550,53 +2077,82 @@ async def get_anomalies(
                         'rid_make', rid_make
                     ) AS details,
                     time AS timestamp
-                FROM recent_drones
-                WHERE alt > 400
+                FROM drones
+                WHERE time >= NOW() - make_interval(hours => $1)
+                    AND track_type = 'drone'
+                    AND alt > 400
+                ORDER BY timestamp DESC, severity_level DESC
+                LIMIT 200
             ),
+            -- Previous sighting per row via idx_drones_drone_id rather than a
+            -- LAG() window, so no CTE has to sort the whole window by drone
             rapid_altitude_changes AS (
                 SELECT
                     'rapid_altitude_change' AS anomaly_type,
                     CASE
-                        WHEN ABS(alt - prev_alt) > 100 THEN 'critical'
-                        WHEN ABS(alt - prev_alt) > 75 THEN 'high'
-                        ELSE 'medium'
-                    END AS severity,
-                    drone_id,
+                        WHEN ABS(d.alt - p.prev_alt) > 100 THEN 2
+                        WHEN ABS(d.alt - p.prev_alt) > 75 THEN 1
+                        ELSE 0
+                    END AS severity_level,
+                    d.drone_id,
                     json_build_object(
-                        'altitude_change_m', ABS(alt - prev_alt),
-                        'time_diff_seconds', EXTRACT(EPOCH FROM (time - prev_time)),
-                        'from_alt', prev_alt,
-                        'to_alt', alt,
-                        'lat', lat,
-                        'lon', lon,
-                        'kit_id', kit_id
+                        'altitude_change_m', ABS(d.alt - p.prev_alt),
+                        'time_diff_seconds', EXTRACT(EPOCH FROM (d.time - p.prev_time)),
+                        'from_alt', p.prev_alt,
+                        'to_alt', d.alt,
+                        'lat', d.lat,
+                        'lon', d.lon,
+                        'kit_id', d.kit_id
                     ) AS details,
-                    time AS timestamp
-                FROM recent_drones
-                WHERE prev_alt IS NOT NULL
-                    AND prev_time IS NOT NULL
-                    AND ABS(alt - prev_alt) > 50
-                    AND EXTRACT(EPOCH FROM (time - prev_time)) <= 10
+                    d.time AS timestamp
+                FROM recent_drones d
+                CROSS JOIN LATERAL (
+                    SELECT alt AS prev_alt, time AS prev_time
+                    FROM drones
+                    WHERE drone_id = d.drone_id
+                        AND time < d.time
+                        AND time >= NOW() - make_interval(hours => $1)
+                        AND track_type = 'drone'
+                    ORDER BY time DESC
+                    LIMIT 1
+                ) p
+                WHERE ABS(d.alt - p.prev_alt) > 50
+                    AND EXTRACT(EPOCH FROM (d.time - p.prev_time)) <= 10
+                ORDER BY timestamp DESC, severity_level DESC
+                LIMIT 200
             )
-            SELECT * FROM speed_anomalies
-            UNION ALL
-            SELECT * FROM altitude_anomalies
-            UNION ALL
-            SELECT * FROM rapid_altitude_changes
-            ORDER BY timestamp DESC, severity DESC
+            -- Each branch is already cut to its own top 200 in the final order,
+            -- so the outer sort sees at most 600 rows however many match.
+            -- Severity is ranked 0-2 throughout (critical sorts first) and only
+            -- labelled for the rows returned.
+            SELECT
+                anomaly_type,
+                (ARRAY['medium', 'high', 'critical'])[severity_level + 1] AS severity,
+                drone_id,
+                details,
+                timestamp
+            FROM (
+                SELECT * FROM speed_anomalies
+                UNION ALL
+                SELECT * FROM altitude_anomalies
+                UNION ALL
+                SELECT * FROM rapid_altitude_changes
+            ) anomalies
+            ORDER BY timestamp DESC, severity_level DESC
             LIMIT 200
         """
 
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, time_window_hours)
-
-        results = [dict(row) for row in rows]
+        rows = await _ttl_cached(
+            _pattern_cache, _pattern_locks, ("anomalies", time_window_hours),
+            PATTERN_CACHE_TTL_SECONDS, PATTERN_CACHE_SIZE,
+            lambda: db_pool.fetch(query, time_window_hours)
+        )
 
-        return {
-            "anomalies": results,
-            "count": len(results),
+        return _raw_json({
+            "anomalies": rows,
+            "count": len(rows),
             "time_window_hours": time_window_hours
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to detect anomalies: {e}")
@@ -1641,6 +2197,14 @@ async def get_multi_kit_detections(
                     AND lon IS NOT NULL
                     AND kit_id IS NOT NULL
             ),
+            multi_kit_drones AS (
+                -- Most drones are only heard by one kit; drop them before the
+                -- DISTINCT ON sort rather than after grouping
+                SELECT drone_id
+                FROM recent_detections
+                GROUP BY drone_id
+                HAVING COUNT(DISTINCT kit_id) >= 2
+            ),
             latest_per_kit AS (
                 -- For each (drone_id, kit_id), get only the MOST RECENT observation
                 -- This ensures times are close together for meaningful comparison
@@ -1656,6 +2220,7 @@ async def get_multi_kit_detections(
                     rid_make,
                     rid_model
                 FROM recent_detections
+                WHERE drone_id IN (SELECT drone_id FROM multi_kit_drones)
                 ORDER BY drone_id, kit_id, time DESC, rssi DESC NULLS LAST
             ),
             multi_kit_groups AS (
@@ -1694,27 +2259,18 @@ async def get_multi_kit_detections(
             LIMIT 100
         """
 
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, time_window_minutes)
-
-        # Parse the kits JSON field (asyncpg returns json_agg as string)
-        results = []
-        for row in rows:
-            row_dict = dict(row)
-            # Parse kits JSON string to actual array
-            if isinstance(row_dict.get('kits'), str):
-                import json
-                try:
-                    row_dict['kits'] = json.loads(row_dict['kits'])
-                except json.JSONDecodeError:
-                    row_dict['kits'] = []
-            results.append(row_dict)
+        rows = await _ttl_cached(
+            _pattern_cache, _pattern_locks, ("multi-kit", time_window_minutes),
+            PATTERN_CACHE_TTL_SECONDS, PATTERN_CACHE_SIZE,
+            lambda: db_pool.fetch(query, time_window_minutes)
+        )
 
-        return {
-            "multi_kit_detections": results,
-            "count": len(results),
+        # kits arrives as a list; the pool's json codec decodes json_agg output
+        return _raw_json({
+            "multi_kit_detections": rows,
+            "count": len(rows),
             "time_window_minutes": time_window_minutes
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query multi-kit detections: {e}")
@@ -1725,19 +2281,23 @@ async def get_multi_kit_detections(
 # RSSI-Based Location Estimation
 # =============================================================================
 
+EARTH_RADIUS_M = 6371000.0
+
+
 def calculate_distance_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance between two GPS coordinates in meters using Haversine formula."""
-    R = 6371000  # Earth's radius in meters
-
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
     delta_lat = math.radians(lat2 - lat1)
     delta_lon = math.radians(lon2 - lon1)
 
     a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # Rounding can push a just past 1.0 for antipodal points
+    if a > 1.0:
+        a = 1.0
+    c = 2 * math.asin(math.sqrt(a))
 
-    return R * c
+    return EARTH_RADIUS_M * c
 
 
 def rssi_to_weight(rssi: float) -> float:
@@ -1999,68 +2559,79 @@ def _trilaterate_3plus_kits(observations: List[dict]) -> dict:
     With 3+ reference points, we can solve for the drone position.
     Uses gradient descent to find the point that minimizes
     the sum of squared errors between estimated and actual distances.
-    """
-    # Extract kit positions and estimated distances
-    kits = []
-    for obs in observations:
-        dist = rssi_to_distance_meters(obs.get('rssi', -70))
-        kits.append({
-            'lat': obs['kit_lat'],
-            'lon': obs['kit_lon'],
-            'dist': dist,
-            'kit_id': obs.get('kit_id')
-        })
 
-    # Initial guess: centroid of kit positions weighted by inverse distance
-    total_weight = sum(1.0 / (k['dist'] + 1) for k in kits)
-    est_lat = sum(k['lat'] / (k['dist'] + 1) for k in kits) / total_weight
-    est_lon = sum(k['lon'] / (k['dist'] + 1) for k in kits) / total_weight
+    Kits are within radio range of each other, so positions are projected once
+    onto a flat local grid in meters (equirectangular, centered on the kits);
+    the search then needs no trig until the result is converted back.
+    """
+    lat0 = sum(obs['kit_lat'] for obs in observations) / len(observations)
+    lon0 = sum(obs['kit_lon'] for obs in observations) / len(observations)
+    m_per_deg_lat = 111320.0
+    m_per_deg_lon = 111320.0 * math.cos(math.radians(lat0))
+
+    # Extract kit positions (meters from the origin) and estimated distances
+    # as flat (x, y, dist) tuples so the descent loop below only does
+    # float arithmetic - no dict lookups per kit per iteration
+    kit_ids = [obs.get('kit_id') for obs in observations]
+    kits = [
+        (
+            (obs['kit_lon'] - lon0) * m_per_deg_lon,
+            (obs['kit_lat'] - lat0) * m_per_deg_lat,
+            rssi_to_distance_meters(obs.get('rssi', -70)),
+        )
+        for obs in observations
+    ]
+    hypot = math.hypot
 
-    # Iterative refinement using gradient descent
-    # Convert to approximate meters for gradient calculation
-    # ~111km per degree latitude, ~85km per degree longitude at mid-latitudes
-    meters_per_deg_lat = 111000
-    meters_per_deg_lon = 85000
+    # Initial guess: centroid of kit positions weighted by inverse distance
+    total_weight = sum(1.0 / (d + 1) for _, _, d in kits)
+    est_x = sum(x / (d + 1) for x, _, d in kits) / total_weight
+    est_y = sum(y / (d + 1) for _, y, d in kits) / total_weight
 
-    learning_rate = 0.5  # Step size in meters equivalent
+    # Iterative refinement using gradient descent. The gradient is averaged
+    # over the kits so the step size doesn't grow with the number of kits
+    learning_rate = 1.0
+    num_kits = len(kits)
 
     for iteration in range(200):
-        grad_lat = 0
-        grad_lon = 0
+        grad_x = 0.0
+        grad_y = 0.0
 
-        for kit in kits:
+        for kx, ky, kd in kits:
             # Current distance from estimate to this kit
-            current_dist = calculate_distance_meters(est_lat, est_lon, kit['lat'], kit['lon'])
-            if current_dist < 1:
-                current_dist = 1
-
-            # Error: difference between current distance and expected distance
-            error = current_dist - kit['dist']
-
-            # Direction from estimate to kit (in degrees)
-            dlat = kit['lat'] - est_lat
-            dlon = kit['lon'] - est_lon
-
-            # Gradient: move toward kit if we're too far, away if too close
-            # Normalize by current distance
-            grad_lat += error * dlat / current_dist
-            grad_lon += error * dlon / current_dist
+            dx = kx - est_x
+            dy = ky - est_y
+            current_dist = hypot(dx, dy)
+            if current_dist < 1.0:
+                current_dist = 1.0
+
+            # Error: difference between current distance and expected distance,
+            # normalized by current distance. Move toward kit if we're too far,
+            # away if too close
+            scale = (current_dist - kd) / current_dist
+            grad_x += scale * dx
+            grad_y += scale * dy
 
         # Update position (move in direction that reduces error)
-        # Scale by learning rate and convert to degrees
-        est_lat += (learning_rate * grad_lat) / meters_per_deg_lat
-        est_lon += (learning_rate * grad_lon) / meters_per_deg_lon
+        step_x = learning_rate * grad_x / num_kits
+        step_y = learning_rate * grad_y / num_kits
+        est_x += step_x
+        est_y += step_y
+
+        # Converged: further iterations would move the estimate by less
+        # than a centimeter
+        if hypot(step_x, step_y) < 0.01:
+            break
 
         # Reduce learning rate over iterations for convergence
         if iteration > 50:
             learning_rate *= 0.99
 
+    est_lat = lat0 + est_y / m_per_deg_lat
+    est_lon = lon0 + est_x / m_per_deg_lon
+
     # Calculate final errors
-    errors = []
-    for kit in kits:
-        actual_dist = calculate_distance_meters(est_lat, est_lon, kit['lat'], kit['lon'])
-        error = abs(actual_dist - kit['dist'])
-        errors.append(error)
+    errors = [abs(hypot(kx - est_x, ky - est_y) - kd) for kx, ky, kd in kits]
 
     # Confidence radius based on mean error and number of kits
     mean_error = sum(errors) / len(errors)
@@ -2075,7 +2646,8 @@ def _trilaterate_3plus_kits(observations: List[dict]) -> dict:
         "confidence_radius_m": round(confidence_radius, 1),
         "method": "trilateration",
         "estimated_distances": [
-            {"kit_id": k['kit_id'], "distance_m": round(k['dist'])} for k in kits
+            {"kit_id": kit_id, "distance_m": round(kd)}
+            for kit_id, (_, _, kd) in zip(kit_ids, kits)
         ],
         "mean_error_m": round(mean_error, 1)
     }
@@ -2178,6 +2750,77 @@ def estimate_location_from_linear_power(observations: List[dict]) -> dict:
     }
 
 
+# GPS position of each kit closest to a target time. Each kit takes the nearest
+# fix on either side of $2 via idx_system_health_kit_id rather than sorting
+# all of its history by distance from $2.
+QUERY_KIT_POSITIONS_AT = """
+    SELECT k.kit_id, p.lat, p.lon, p.alt
+    FROM unnest($1::text[]) AS k(kit_id)
+    CROSS JOIN LATERAL (
+        SELECT lat, lon, alt
+        FROM (
+            (SELECT lat, lon, alt, time
+             FROM system_health
+             WHERE kit_id = k.kit_id AND time <= $2
+               AND lat IS NOT NULL AND lon IS NOT NULL
+               AND lat != 0 AND lon != 0
+             ORDER BY time DESC
+             LIMIT 1)
+            UNION ALL
+            (SELECT lat, lon, alt, time
+             FROM system_health
+             WHERE kit_id = k.kit_id AND time > $2
+               AND lat IS NOT NULL AND lon IS NOT NULL
+               AND lat != 0 AND lon != 0
+             ORDER BY time
+             LIMIT 1)
+        ) nearest
+        ORDER BY ABS(EXTRACT(EPOCH FROM (nearest.time - $2)))
+        LIMIT 1
+    ) p
+"""
+
+
+async def _kit_positions_at(conn, kit_ids: List[str], target_time: datetime) -> dict:
+    """
+    Return {kit_id: {"lat", "lon", "alt"}} for kits with a GPS fix near target_time.
+
+    Positions are cached per kit and minute of target_time; only kits not in
+    the cache are looked up, in a single query. Kits without a fix are omitted
+    and looked up again on the next call.
+    """
+    bucket = int(target_time.timestamp() // 60)
+    now = time.monotonic()
+    positions = {}
+    missing = []
+    for kit_id in kit_ids:
+        entry = _kit_position_cache.get((kit_id, bucket))
+        if entry is not None and now - entry[0] < KIT_POSITION_CACHE_TTL_SECONDS:
+            positions[kit_id] = entry[1]
+        else:
+            missing.append(kit_id)
+
+    if missing:
+        rows = await conn.fetch(QUERY_KIT_POSITIONS_AT, missing, target_time)
+        found = {
+            row['kit_id']: {
+                "lat": float(row['lat']),
+                "lon": float(row['lon']),
+                "alt": float(row['alt']) if row['alt'] else 0
+            }
+            for row in rows
+        }
+        # Only fixes are cached: a kit without one may report it any moment
+        for kit_id, pos in found.items():
+            _kit_position_cache[(kit_id, bucket)] = (now, pos)
+            _kit_position_cache.move_to_end((kit_id, bucket))
+            positions[kit_id] = pos
+        while len(_kit_position_cache) > KIT_POSITION_CACHE_SIZE:
+            _kit_position_cache.popitem(last=False)
+
+    return positions
+
+
 @app.get("/api/analysis/estimate-location/{drone_id}", response_model=LocationEstimate)
 async def estimate_drone_location(
     drone_id: str,
@@ -2220,64 +2863,59 @@ async def estimate_drone_location(
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid timestamp format. Use ISO 8601.")
         else:
-            target_time = datetime.utcnow()
+            target_time = datetime.now(timezone.utc)
 
         # Get drone observations within time window
         time_start = target_time - timedelta(seconds=time_window_seconds)
         time_end = target_time + timedelta(seconds=time_window_seconds)
 
-        async with db_pool.acquire() as conn:
-            # Get drone observations from different kits
-            drone_query = """
-                SELECT
-                    d.kit_id,
-                    d.rssi,
-                    d.freq,
-                    d.time,
-                    d.lat as drone_lat,
-                    d.lon as drone_lon,
-                    d.alt as drone_alt
-                FROM drones d
-                WHERE d.drone_id = $1
-                  AND d.time >= $2 AND d.time <= $3
-                ORDER BY d.time DESC
-            """
-            drone_rows = await conn.fetch(drone_query, drone_id, time_start, time_end)
+        # Get the best (strongest, then most recent) observation from each kit
+        drone_query = """
+            SELECT DISTINCT ON (d.kit_id)
+                d.kit_id,
+                d.rssi,
+                d.freq,
+                d.time,
+                d.lat as drone_lat,
+                d.lon as drone_lon
+            FROM drones d
+            WHERE d.drone_id = $1
+              AND d.time >= $2 AND d.time <= $3
+            ORDER BY d.kit_id, COALESCE(NULLIF(d.rssi, 0), -100) DESC, d.time DESC
+        """
+        drone_rows = await db_pool.fetch(drone_query, drone_id, time_start, time_end)
 
-            if not drone_rows:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No observations found for drone {drone_id} in time window"
-                )
+        if not drone_rows:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No observations found for drone {drone_id} in time window"
+            )
 
-            # Get unique kit IDs that observed this drone
-            kit_ids = list(set(row['kit_id'] for row in drone_rows if row['kit_id']))
+        # Get unique kit IDs that observed this drone
+        kit_ids = list(set(row['kit_id'] for row in drone_rows if row['kit_id']))
 
-            if len(kit_ids) < 1:
-                raise HTTPException(
-                    status_code=400,
-                    detail="No kit observations with RSSI data available"
-                )
+        if len(kit_ids) < 1:
+            raise HTTPException(
+                status_code=400,
+                detail="No kit observations with RSSI data available"
+            )
 
-            # Get kit positions from system_health table (closest to observation time)
-            kit_positions = {}
-            for kit_id in kit_ids:
-                kit_pos_query = """
-                    SELECT lat, lon, alt, time
-                    FROM system_health
-                    WHERE kit_id = $1
-                      AND lat IS NOT NULL AND lon IS NOT NULL
-                      AND lat != 0 AND lon != 0
-                    ORDER BY ABS(EXTRACT(EPOCH FROM (time - $2)))
-                    LIMIT 1
-                """
-                kit_row = await conn.fetchrow(kit_pos_query, kit_id, target_time)
-                if kit_row:
-                    kit_positions[kit_id] = {
-                        "lat": float(kit_row['lat']),
-                        "lon": float(kit_row['lon']),
-                        "alt": float(kit_row['alt']) if kit_row['alt'] else 0
-                    }
+        # Kit positions from system_health (closest to observation time) and the
+        # drone's reported position from the observation closest to target time
+        # are independent, so look them up concurrently. Each runs on its own
+        # pooled connection; none is held while waiting for another.
+        closest_query = """
+            SELECT lat as drone_lat, lon as drone_lon
+            FROM drones
+            WHERE drone_id = $1
+              AND time >= $2 AND time <= $3
+            ORDER BY ABS(EXTRACT(EPOCH FROM (time - $4))), time DESC
+            LIMIT 1
+        """
+        kit_positions, closest_obs = await asyncio.gather(
+            _kit_positions_at(db_pool, kit_ids, target_time),
+            db_pool.fetchrow(closest_query, drone_id, time_start, time_end, target_time),
+        )
 
         if not kit_positions:
             raise HTTPException(
@@ -2286,30 +2924,20 @@ async def estimate_drone_location(
             )
 
         # Build observations list with kit positions and RSSI
-        # Use the best (most recent or strongest) observation per kit
-        observations = []
-        kit_observations = {}
-
-        for row in drone_rows:
-            kit_id = row['kit_id']
-            if kit_id not in kit_positions:
-                continue
-
-            # Keep best observation per kit (highest RSSI)
-            current_rssi = row['rssi'] or -100
-            if kit_id not in kit_observations or (kit_observations[kit_id].get('rssi') or -100) < current_rssi:
-                kit_observations[kit_id] = {
-                    "kit_id": kit_id,
-                    "kit_lat": kit_positions[kit_id]['lat'],
-                    "kit_lon": kit_positions[kit_id]['lon'],
-                    "rssi": row['rssi'],
-                    "freq": row['freq'],
-                    "time": row['time'].isoformat() if row['time'] else None,
-                    "drone_lat": float(row['drone_lat']) if row['drone_lat'] else None,
-                    "drone_lon": float(row['drone_lon']) if row['drone_lon'] else None
-                }
-
-        observations = list(kit_observations.values())
+        observations = [
+            {
+                "kit_id": row['kit_id'],
+                "kit_lat": kit_positions[row['kit_id']]['lat'],
+                "kit_lon": kit_positions[row['kit_id']]['lon'],
+                "rssi": row['rssi'],
+                "freq": row['freq'],
+                "time": row['time'].isoformat() if row['time'] else None,
+                "drone_lat": float(row['drone_lat']) if row['drone_lat'] else None,
+                "drone_lon": float(row['drone_lon']) if row['drone_lon'] else None
+            }
+            for row in drone_rows
+            if row['kit_id'] in kit_positions
+        ]
 
         if len(observations) < 1:
             raise HTTPException(
@@ -2319,8 +2947,7 @@ async def estimate_drone_location(
 
         # Get actual drone position (for comparison) from the closest observation
         actual_pos = None
-        closest_obs = min(drone_rows, key=lambda r: abs((r['time'] - target_time).total_seconds()) if r['time'] else float('inf'))
-        if closest_obs['drone_lat'] and closest_obs['drone_lon']:
+        if closest_obs and closest_obs['drone_lat'] and closest_obs['drone_lon']:
             actual_pos = {
                 "lat": float(closest_obs['drone_lat']),
                 "lon": float(closest_obs['drone_lon'])
@@ -2407,16 +3034,17 @@ async def estimate_signal_location(
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid timestamp format. Use ISO 8601.")
         else:
-            target_time = datetime.utcnow()
+            target_time = datetime.now(timezone.utc)
 
         # Get signal observations within time window
         time_start = target_time - timedelta(seconds=time_window_seconds)
         time_end = target_time + timedelta(seconds=time_window_seconds)
 
         async with db_pool.acquire() as conn:
-            # Get signal observations from different kits on this frequency
+            # Get the best (strongest, then most recent) observation from each
+            # kit on this frequency
             signal_query = """
-                SELECT
+                SELECT DISTINCT ON (s.kit_id)
                     s.kit_id,
                     s.power_dbm,
                     s.freq_mhz,
@@ -2429,7 +3057,7 @@ async def estimate_signal_location(
                 WHERE s.freq_mhz >= $1 - 0.5 AND s.freq_mhz <= $1 + 0.5
                   AND s.time >= $2 AND s.time <= $3
                   AND s.power_dbm IS NOT NULL
-                ORDER BY s.time DESC
+                ORDER BY s.kit_id, COALESCE(NULLIF(s.power_dbm, 0), -100) DESC, s.time DESC
             """
             signal_rows = await conn.fetch(signal_query, freq_mhz, time_start, time_end)
 
@@ -2449,24 +3077,7 @@ async def estimate_signal_location(
                 )
 
             # Get kit positions from system_health table (closest to observation time)
-            kit_positions = {}
-            for kit_id in kit_ids:
-                kit_pos_query = """
-                    SELECT lat, lon, alt, time
-                    FROM system_health
-                    WHERE kit_id = $1
-                      AND lat IS NOT NULL AND lon IS NOT NULL
-                      AND lat != 0 AND lon != 0
-                    ORDER BY ABS(EXTRACT(EPOCH FROM (time - $2)))
-                    LIMIT 1
-                """
-                kit_row = await conn.fetchrow(kit_pos_query, kit_id, target_time)
-                if kit_row:
-                    kit_positions[kit_id] = {
-                        "lat": float(kit_row['lat']),
-                        "lon": float(kit_row['lon']),
-                        "alt": float(kit_row['alt']) if kit_row['alt'] else 0
-                    }
+            kit_positions = await _kit_positions_at(conn, kit_ids, target_time)
 
         if not kit_positions:
             raise HTTPException(
@@ -2475,29 +3086,20 @@ async def estimate_signal_location(
             )
 
         # Build observations list with kit positions and power_dbm (as rssi)
-        # Use the best (strongest) observation per kit
-        kit_observations = {}
-
-        for row in signal_rows:
-            kit_id = row['kit_id']
-            if kit_id not in kit_positions:
-                continue
-
-            # Keep best observation per kit (highest power_dbm/rssi)
-            current_rssi = row['power_dbm'] or -100
-            if kit_id not in kit_observations or (kit_observations[kit_id].get('rssi') or -100) < current_rssi:
-                kit_observations[kit_id] = {
-                    "kit_id": kit_id,
-                    "kit_lat": kit_positions[kit_id]['lat'],
-                    "kit_lon": kit_positions[kit_id]['lon'],
-                    "rssi": row['power_dbm'],  # power_dbm is rssi for signals
-                    "freq_mhz": row['freq_mhz'],
-                    "time": row['time'].isoformat() if row['time'] else None,
-                    "pal_conf": float(row['pal_conf']) if row['pal_conf'] else None,
-                    "ntsc_conf": float(row['ntsc_conf']) if row['ntsc_conf'] else None
-                }
-
-        observations = list(kit_observations.values())
+        observations = [
+            {
+                "kit_id": row['kit_id'],
+                "kit_lat": kit_positions[row['kit_id']]['lat'],
+                "kit_lon": kit_positions[row['kit_id']]['lon'],
+                "rssi": row['power_dbm'],  # power_dbm is rssi for signals
+                "freq_mhz": row['freq_mhz'],
+                "time": row['time'].isoformat() if row['time'] else None,
+                "pal_conf": float(row['pal_conf']) if row['pal_conf'] else None,
+                "ntsc_conf": float(row['ntsc_conf']) if row['ntsc_conf'] else None
+            }
+            for row in signal_rows
+            if row['kit_id'] in kit_positions
+        ]
 
         if len(observations) < 1:
             raise HTTPException(
@@ -2583,10 +3185,7 @@ async def get_security_alerts(
             LIMIT 500
         """
 
-        async with db_pool.acquire() as conn:
-            rows = await conn.fetch(query, time_window_hours)
-
-        alerts = [dict(row) for row in rows]
+        alerts = await db_pool.fetch(query, time_window_hours)
 
         # Count by threat level
         level_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
@@ -2595,12 +3194,12 @@ async def get_security_alerts(
             if level in level_counts:
                 level_counts[level] += 1
 
-        return {
+        return _raw_json({
             "alerts": alerts,
             "count": len(alerts),
             "time_window_hours": time_window_hours,
             "threat_summary": level_counts
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query security alerts: {e}")
@@ -2633,12 +3232,11 @@ async def get_loitering_activity(
     try:
         query = """SELECT detect_loitering($1, $2, $3, $4, $5)"""
 
-        async with db_pool.acquire() as conn:
-            result = await conn.fetchval(query, lat, lon, radius_m, min_duration_minutes, time_window_hours)
+        result = await db_pool.fetchval(query, lat, lon, radius_m, min_duration_minutes, time_window_hours)
 
         loitering = result if result else []
 
-        return {
+        return _raw_json({
             "loitering_drones": loitering,
             "count": len(loitering) if loitering else 0,
             "search_area": {
@@ -2650,7 +3248,7 @@ async def get_loitering_activity(
                 "min_duration_minutes": min_duration_minutes,
                 "time_window_hours": time_window_hours
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query loitering activity: {e}")
@@ -2682,15 +3280,14 @@ async def get_rapid_descent_events(
     try:
         query = """SELECT detect_rapid_descent($1, $2, $3)"""
 
-        async with db_pool.acquire() as conn:
-            result = await conn.fetchval(query, time_window_minutes, min_descent_rate_mps, min_descent_m)
+        result = await db_pool.fetchval(query, time_window_minutes, min_descent_rate_mps, min_descent_m)
 
         descents = result if result else []
 
         # Count likely payload drops (rapid descent + low horizontal speed)
         payload_drops = sum(1 for d in descents if d.get('possible_payload_drop', False)) if descents else 0
 
-        return {
+        return _raw_json({
             "descent_events": descents,
             "count": len(descents) if descents else 0,
             "possible_payload_drops": payload_drops,
@@ -2699,7 +3296,7 @@ async def get_rapid_descent_events(
                 "min_descent_rate_mps": min_descent_rate_mps,
                 "min_descent_m": min_descent_m
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query rapid descent events: {e}")
@@ -2729,8 +3326,7 @@ async def get_night_activity(
     try:
         query = """SELECT detect_night_activity($1, $2, $3)"""
 
-        async with db_pool.acquire() as conn:
-            result = await conn.fetchval(query, time_window_hours, night_start_hour, night_end_hour)
+        result = await db_pool.fetchval(query, time_window_hours, night_start_hour, night_end_hour)
 
         activity = result if result else []
 
@@ -2742,7 +3338,7 @@ async def get_night_activity(
                 if level in risk_counts:
                     risk_counts[level] += 1
 
-        return {
+        return _raw_json({
             "night_activity": activity,
             "count": len(activity) if activity else 0,
             "risk_summary": risk_counts,
@@ -2751,7 +3347,7 @@ async def get_night_activity(
                 "night_start_hour": night_start_hour,
                 "night_end_hour": night_end_hour
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to query night activity: {e}")
@@ -3232,6 +3828,10 @@ async def enterprise_startup():
         audit_log.set_db_pool(db_pool)
         audit_system_startup()
 
+    # Start background webhook delivery
+    if ALERTING_AVAILABLE and alert_manager:
+        await alert_manager.start()
+
     # Log startup info
     logger.info(f"Enterprise features: auth={AUTH_AVAILABLE and is_auth_enabled()}, "
                 f"alerting={ALERTING_AVAILABLE and alert_manager and alert_manager.is_enabled()}, "
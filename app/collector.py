@@ -15,6 +15,7 @@ Features:
 """
 
 import asyncio
+import hashlib
 import logging
 import signal
 import sys
@@ -889,7 +890,7 @@ class CollectorService:
                             VALUES (:kit_id, :name, :api_url, :location, 'unknown', TRUE, NOW())
                             ON CONFLICT (kit_id) DO NOTHING
                         """), {
-                            'kit_id': kit.get('id', f"kit-yaml-{hash(api_url) % 10000}"),
+                            'kit_id': kit.get('id', f"kit-yaml-{hashlib.blake2b(api_url.encode(), digest_size=2).hexdigest()}"),
                             'name': kit.get('name', kit.get('id', api_url)),
                             'api_url': api_url,
                             'location': kit.get('location')
@@ -371,6 +371,13 @@ def mock_asyncpg_connection():
     # Default responses
     conn.fetchval.return_value = 1  # For health checks
     conn.fetch.return_value = []  # Default empty result
+    conn.copy_from_query.return_value = "COPY 0"
+
+    # conn.transaction() is a plain call returning an async context manager
+    transaction = AsyncMock()
+    transaction.__aenter__.return_value = None
+    transaction.__aexit__.return_value = None
+    conn.transaction = MagicMock(return_value=transaction)
 
     return conn
 
@@ -392,7 +399,13 @@ def mock_asyncpg_pool(mock_asyncpg_connection):
     acquire_context = AsyncMock()
     acquire_context.__aenter__.return_value = mock_asyncpg_connection
     acquire_context.__aexit__.return_value = None
-    pool.acquire.return_value = acquire_context
+    pool.acquire = MagicMock(return_value=acquire_context)
+
+    # Pool-level shortcuts run on the same mock connection
+    pool.fetch = mock_asyncpg_connection.fetch
+    pool.fetchval = mock_asyncpg_connection.fetchval
+    pool.fetchrow = mock_asyncpg_connection.fetchrow
+    pool.execute = mock_asyncpg_connection.execute
 
     return pool
 
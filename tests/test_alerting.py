@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""
+Tests for the webhook alerting module.
+
+All webhook HTTP calls are mocked - no network access required.
+
+Run with: pytest tests/test_alerting.py -v
+"""
+
+import pytest
+import asyncio
+import os
+import sys
+from dataclasses import FrozenInstanceError, replace
+from unittest.mock import AsyncMock, MagicMock
+
+# Add app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from alerting import (
+    Alert,
+    AlertManager,
+    AlertSeverity,
+    AlertType,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def manager():
+    """AlertManager with alerting enabled and no env-configured webhooks."""
+    mgr = AlertManager()
+    mgr._webhooks = []
+    mgr._enabled = True
+    return mgr
+
+
+@pytest.fixture
+def sample_alert():
+    """A simple new-drone alert."""
+    return Alert(
+        alert_type=AlertType.NEW_DRONE,
+        severity=AlertSeverity.INFO,
+        title="New Drone Detected: drone-001",
+        message="A new drone has been detected by the system.",
+        details={"drone_id": "drone-001", "kit_id": "kit-001"},
+    )
+
+
+def _install_client(manager, client):
+    """Use client for every webhook configured on manager."""
+    for webhook in manager._webhooks:
+        webhook["client"] = client
+    return client
+
+
+def _mock_client(status_code=200):
+    """Build a mock httpx.AsyncClient whose post() returns status_code."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = ""
+    client = MagicMock()
+    client.post = AsyncMock(return_value=response)
+    client.aclose = AsyncMock()
+    return client
+
+
+# =============================================================================
+# Webhook Fan-out Tests
+# =============================================================================
+
+class TestSendAlert:
+    """Tests for AlertManager.send_alert."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_skips_send(self, manager, sample_alert):
+        manager._enabled = False
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        assert await manager.send_alert(sample_alert) is False
+
+    @pytest.mark.asyncio
+    async def test_sends_to_all_webhooks(self, manager, sample_alert):
+        manager.add_webhook("slack", "http://example.invalid/slack")
+        manager.add_webhook("discord", "http://example.invalid/discord")
+        manager.add_webhook("generic", "http://example.invalid/generic")
+        _install_client(manager, _mock_client())
+
+        client = manager._webhooks[0]["client"]
+        assert await manager.send_alert(sample_alert) is True
+        assert client.post.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_one_failure_does_not_block_others(self, manager, sample_alert):
+        manager.add_webhook("generic", "http://example.invalid/a")
+        manager.add_webhook("generic", "http://example.invalid/b")
+
+        ok = MagicMock(status_code=200, text="")
+        client = _mock_client()
+        client.post = AsyncMock(side_effect=[Exception("boom"), ok])
+        _install_client(manager, client)
+
+        assert await manager.send_alert(sample_alert) is True
+        assert client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_webhooks_sent_concurrently(self, manager, sample_alert):
+        manager.add_webhook("generic", "http://example.invalid/a")
+        manager.add_webhook("generic", "http://example.invalid/b")
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(status_code=204, text="")
+
+        client = _mock_client()
+        client.post = slow_post
+        _install_client(manager, client)
+
+        assert await manager.send_alert(sample_alert) is True
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_all_failures_returns_false(self, manager, sample_alert):
+        manager.add_webhook("generic", "http://example.invalid/a")
+        _install_client(manager, _mock_client(status_code=403))
+
+        assert await manager.send_alert(sample_alert) is False
+
+
+# =============================================================================
+# HTTP Client Lifecycle Tests
+# =============================================================================
+
+class TestHttpClient:
+    """Tests for the shared webhook HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_created_once_under_concurrency(self, manager):
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        webhook = manager._webhooks[0]
+        clients = await asyncio.gather(*[manager._get_client_for(webhook) for _ in range(10)])
+        assert all(c is clients[0] for c in clients)
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_dedicated_client_per_webhook(self, manager):
+        manager.add_webhook("slack", "http://example.invalid/slack")
+        manager.add_webhook("discord", "http://example.invalid/discord")
+        slack = await manager._get_client_for(manager._webhooks[0])
+        discord = await manager._get_client_for(manager._webhooks[1])
+        assert slack is not discord
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_clients(self):
+        async with AlertManager() as mgr:
+            mgr.add_webhook("generic", "http://example.invalid/hook")
+            await mgr._get_client_for(mgr._webhooks[-1])
+            assert mgr._webhooks[-1]["client"] is not None
+        assert mgr._webhooks[-1]["client"] is None
+
+
+# =============================================================================
+# Throttling Tests
+# =============================================================================
+
+class TestThrottling:
+    """Tests for per-key alert throttling."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_alert_throttled(self, manager, sample_alert):
+        assert await manager._is_throttled(sample_alert) is False
+        assert await manager._is_throttled(sample_alert) is True
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_throttled(self, manager, sample_alert):
+        other = Alert(
+            alert_type=AlertType.NEW_DRONE,
+            severity=AlertSeverity.INFO,
+            title="New Drone Detected: drone-002",
+            message="",
+            details={"drone_id": "drone-002"},
+        )
+        assert await manager._is_throttled(sample_alert) is False
+        assert await manager._is_throttled(other) is False
+
+    @pytest.mark.asyncio
+    async def test_cooldown_expiry(self, manager, sample_alert, monkeypatch):
+        import alerting
+        clock = [1000.0]
+        monkeypatch.setattr(alerting.time, "monotonic", lambda: clock[0])
+        manager._last_purge = clock[0]
+
+        assert await manager._is_throttled(sample_alert) is False
+        clock[0] += alerting.ALERT_COOLDOWN_SECONDS + 1
+        assert await manager._is_throttled(sample_alert) is False
+
+    @pytest.mark.asyncio
+    async def test_throttle_map_bounded(self, manager):
+        manager._throttle_cap = 5
+        for i in range(20):
+            await manager._is_throttled(Alert(
+                alert_type=AlertType.NEW_DRONE,
+                severity=AlertSeverity.INFO,
+                title="",
+                message="",
+                details={"drone_id": f"drone-{i}"},
+            ))
+        assert len(manager._last_alerts) == 5
+        assert (AlertType.NEW_DRONE, "drone-19") in manager._last_alerts
+        assert (AlertType.NEW_DRONE, "drone-0") not in manager._last_alerts
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_suppressed(self, manager, sample_alert):
+        results = await asyncio.gather(
+            *[manager._is_throttled(sample_alert) for _ in range(10)]
+        )
+        assert results.count(False) == 1
+
+    @pytest.mark.parametrize("alert_type,details,severity,expected", [
+        (AlertType.NEW_DRONE, {"drone_id": "d1"}, AlertSeverity.INFO, (AlertType.NEW_DRONE, "d1")),
+        (AlertType.WATCHLIST_MATCH, {}, AlertSeverity.HIGH, (AlertType.WATCHLIST_MATCH, None)),
+        (AlertType.KIT_OFFLINE, {"kit_id": "k1"}, AlertSeverity.WARNING, ("kit_status", "k1")),
+        (AlertType.KIT_ONLINE, {"kit_id": "k1"}, AlertSeverity.INFO, ("kit_status", "k1")),
+        (AlertType.ANOMALY, {"drone_id": "d1"}, AlertSeverity.HIGH, (AlertType.ANOMALY, AlertSeverity.HIGH)),
+    ])
+    def test_throttle_keys(self, manager, alert_type, details, severity, expected):
+        alert = Alert(alert_type=alert_type, severity=severity, title="", message="", details=details)
+        assert manager._get_throttle_key(alert) == expected
+
+
+# =============================================================================
+# Payload Formatting Tests
+# =============================================================================
+
+class TestFormatting:
+    """Tests for Slack/Discord/generic payload formatting."""
+
+    def test_slack_payload(self, manager):
+        alert = Alert(
+            alert_type=AlertType.WATCHLIST_MATCH,
+            severity=AlertSeverity.CRITICAL,
+            title="Watchlist Match: d1",
+            message="msg",
+            details={"drone_id": "d1", "rid_make": None},
+        )
+        attachment = manager._format_slack_message(alert)["attachments"][0]
+        assert attachment["color"] == "#ff0000"
+        assert attachment["pretext"] == ":fire: *WarDragon Alert*"
+        assert attachment["fallback"] == ":fire: Watchlist Match: d1"
+        assert attachment["fields"] == [{"title": "Drone Id", "value": "d1", "short": True}]
+        assert attachment["ts"] == int(alert.timestamp_epoch)
+
+    def test_discord_payload(self, manager, sample_alert):
+        embed = manager._format_discord_message(sample_alert)["embeds"][0]
+        assert embed["color"] == 0x36a64f
+        assert embed["title"] == f"WarDragon Alert: {sample_alert.title}"
+        assert {"name": "Kit Id", "value": "kit-001", "inline": True} in embed["fields"]
+
+    def test_alert_is_immutable(self, sample_alert):
+        with pytest.raises(FrozenInstanceError):
+            sample_alert.title = "changed"
+
+    def test_field_limits(self, manager):
+        alert = Alert(
+            alert_type=AlertType.ANOMALY,
+            severity=AlertSeverity.HIGH,
+            title="t",
+            message="m",
+            details={f"key_{i}": (None if i % 2 else i) for i in range(100)},
+        )
+        slack_fields = manager._format_slack_message(alert)["attachments"][0]["fields"]
+        discord_fields = manager._format_discord_message(alert)["embeds"][0]["fields"]
+        assert len(slack_fields) == 10
+        assert len(discord_fields) == 25
+        assert slack_fields[1] == {"title": "Key 2", "value": "2", "short": True}
+
+    @pytest.mark.asyncio
+    async def test_payload_sent_as_json_bytes(self, manager, sample_alert):
+        import json
+        manager.add_webhook("generic", "http://example.invalid/hook", headers={"X-Token": "t"})
+        _install_client(manager, _mock_client())
+
+        assert await manager.send_alert(sample_alert) is True
+        kwargs = manager._webhooks[0]["client"].post.call_args.kwargs
+        assert json.loads(kwargs["content"]) == sample_alert.to_dict()
+        assert kwargs["headers"] == {"Content-Type": "application/json", "X-Token": "t"}
+
+
+# =============================================================================
+# Background Queue Tests
+# =============================================================================
+
+class TestAlertQueue:
+    """Tests for queued background alert delivery."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_delivers_in_background(self, manager, sample_alert):
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        _install_client(manager, _mock_client())
+
+        client = manager._webhooks[0]["client"]
+        assert manager.enqueue(sample_alert) is True
+        await asyncio.wait_for(manager._queue.join(), timeout=1)
+
+        assert client.post.await_count == 1
+        await manager.close()
+        assert manager._worker_task is None
+
+    @pytest.mark.asyncio
+    async def test_close_delivers_queued_alerts(self, manager, sample_alert):
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        client = _install_client(manager, _mock_client())
+
+        for i in range(5):
+            manager.enqueue(replace(sample_alert, details={"drone_id": f"drone-{i}"}))
+        await manager.close()
+
+        assert client.post.await_count == 5
+        assert manager._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_slow_webhook_does_not_block_other_alerts(self, manager, sample_alert):
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        client = _install_client(manager, _mock_client())
+        release = asyncio.Event()
+        delivered = []
+
+        async def post(url, content, headers):
+            if b"drone-slow" in content:
+                await release.wait()
+            delivered.append(content)
+            return MagicMock(status_code=200, text="")
+
+        client.post = AsyncMock(side_effect=post)
+
+        manager.enqueue(replace(sample_alert, details={"drone_id": "drone-slow"}))
+        await asyncio.sleep(0.01)  # Worker picks up the slow alert on its own
+        manager.enqueue(replace(sample_alert, details={"drone_id": "drone-fast"}))
+        for _ in range(20):
+            if delivered:
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(delivered) == 1 and b"drone-fast" in delivered[0]
+        release.set()
+        await manager.close()
+        assert len(delivered) == 2
+
+    @pytest.mark.asyncio
+    async def test_enqueue_full_queue_drops(self, manager, sample_alert):
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        manager._queue = asyncio.Queue(maxsize=1)
+        manager._ensure_worker = lambda: None
+
+        assert manager.enqueue(sample_alert) is True
+        assert manager.enqueue(sample_alert) is False
+
+    @pytest.mark.asyncio
+    async def test_helper_enqueues(self, manager, monkeypatch):
+        import alerting
+        monkeypatch.setattr(alerting, "alert_manager", manager)
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        manager._ensure_worker = lambda: None
+
+        assert await alerting.alert_kit_status("kit-001", "offline") is True
+        queued = manager._queue.get_nowait()
+        assert queued.alert_type == AlertType.KIT_OFFLINE
+        assert queued.severity == AlertSeverity.WARNING
+
+    @pytest.mark.asyncio
+    async def test_helper_noop_when_disabled(self, manager, monkeypatch):
+        import alerting
+        monkeypatch.setattr(alerting, "alert_manager", manager)
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        manager._enabled = False
+        monkeypatch.setattr(alerting, "Alert", MagicMock(side_effect=AssertionError("built")))
+
+        assert await alerting.alert_new_drone("drone-001") is False
+        assert manager._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_disabled_not_queued(self, manager, sample_alert):
+        assert manager.enqueue(sample_alert) is False
+        assert manager._queue.empty()
+        assert manager._worker_task is None
+
+
+# =============================================================================
+# Suppressed Alert Summary Tests
+# =============================================================================
+
+class TestSuppressedSummaries:
+    """Tests for run-length summaries of throttled alerts."""
+
+    @pytest.mark.asyncio
+    async def test_summary_after_cooldown(self, manager, sample_alert, monkeypatch):
+        import alerting
+        clock = [1000.0]
+        monkeypatch.setattr(alerting.time, "monotonic", lambda: clock[0])
+        manager._last_purge = clock[0]
+
+        assert await manager._is_throttled(sample_alert) is False
+        # Identical repeats are counted too
+        for _ in range(3):
+            assert await manager._is_throttled(sample_alert) is True
+
+        # Nothing to report while still inside the cooldown
+        assert await manager._collect_suppressed() == []
+
+        clock[0] += alerting.ALERT_COOLDOWN_SECONDS
+        summaries = await manager._collect_suppressed()
+        assert len(summaries) == 1
+        assert summaries[0].title == f"{sample_alert.title} (+3 more)"
+        assert summaries[0].details["suppressed_count"] == 3
+        assert summaries[0].details["drone_id"] == "drone-001"
+
+        # Counter was reset
+        assert await manager._collect_suppressed() == []
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_survive_purge(self, manager, sample_alert, monkeypatch):
+        import alerting
+        clock = [1000.0]
+        monkeypatch.setattr(alerting.time, "monotonic", lambda: clock[0])
+
+        await manager._is_throttled(sample_alert)
+        await manager._is_throttled(sample_alert)
+        manager._purge_expired(clock[0] + alerting.ALERT_COOLDOWN_SECONDS)
+        assert len(manager._last_alerts) == 1
+
+
+# =============================================================================
+# Push Gating Tests
+# =============================================================================
+
+class TestPushGating:
+    """Tests for score- and rate-based push decisions."""
+
+    def test_fresh_info_alert_pushed(self, manager, sample_alert):
+        assert manager._should_push(sample_alert) is True
+
+    def test_stale_low_severity_alert_not_pushed(self, manager, sample_alert):
+        stale = replace(sample_alert, timestamp_epoch=sample_alert.timestamp_epoch - 3600)
+        assert manager._should_push(stale) is False
+
+    def test_stale_high_severity_alert_pushed(self, manager, sample_alert):
+        stale = replace(
+            sample_alert,
+            severity=AlertSeverity.CRITICAL,
+            timestamp_epoch=sample_alert.timestamp_epoch - 3600,
+        )
+        assert manager._should_push(stale) is True
+
+    def test_lowest_scoring_alert_pushed_while_fresh(self, manager):
+        import alerting
+        kit_online = Alert(
+            alert_type=AlertType.KIT_ONLINE,
+            severity=AlertSeverity.INFO,
+            title="Kit Online: kit-001",
+            message="Kit is back online.",
+        )
+        assert manager._should_push(kit_online) is True
+
+        # Still pushed after waiting out a full webhook retry budget
+        delayed = replace(
+            kit_online,
+            timestamp_epoch=kit_online.timestamp_epoch - alerting.WEBHOOK_RETRY_BUDGET_SECONDS,
+        )
+        assert manager._should_push(delayed) is True
+
+    def test_rate_limit(self, manager, sample_alert, monkeypatch):
+        import alerting
+        monkeypatch.setattr(alerting, "ALERT_PUSH_RATE_LIMIT", 3)
+        results = [manager._should_push(sample_alert) for _ in range(5)]
+        assert results == [True, True, True, False, False]
+
+    @pytest.mark.asyncio
+    async def test_rejected_alert_does_not_start_cooldown(self, manager, sample_alert, monkeypatch):
+        import alerting
+        monkeypatch.setattr(alerting, "ALERT_PUSH_RATE_LIMIT", 0)
+        assert await manager._is_throttled(sample_alert) is True
+        assert manager._get_throttle_key(sample_alert) not in manager._last_alerts
+
+        monkeypatch.setattr(alerting, "ALERT_PUSH_RATE_LIMIT", 60)
+        assert await manager._is_throttled(replace(sample_alert, message="again")) is False
+
+    @pytest.mark.asyncio
+    async def test_summaries_rate_limited(self, manager, sample_alert, monkeypatch):
+        import alerting
+        clock = [1000.0]
+        monkeypatch.setattr(alerting.time, "monotonic", lambda: clock[0])
+        manager._last_purge = clock[0]
+
+        assert await manager._is_throttled(sample_alert) is False
+        for _ in range(3):
+            assert await manager._is_throttled(sample_alert) is True
+
+        # Rate deque full: the summary is held back, its count kept
+        clock[0] += alerting.ALERT_COOLDOWN_SECONDS
+        manager._push_times.extend([clock[0]] * alerting.ALERT_PUSH_RATE_LIMIT)
+        assert await manager._collect_suppressed() == []
+        assert manager._last_alerts[manager._get_throttle_key(sample_alert)].suppressed == 3
+
+        clock[0] += 60
+        summaries = await manager._collect_suppressed()
+        assert len(summaries) == 1
+        assert summaries[0].details["suppressed_count"] == 3
+
+
+# =============================================================================
+# Header Handling Tests
+# =============================================================================
+
+class TestHeaders:
+    """Tests for webhook header parsing and pre-merging."""
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("", {}),
+        ('{"Authorization": "Bearer x"}', {"Authorization": "Bearer x"}),
+        ("not json", {}),
+        ('["a", "b"]', {}),
+    ])
+    def test_parse_headers(self, raw, expected):
+        from alerting import _parse_headers
+        assert _parse_headers(raw) == expected
+
+    def test_headers_premerged_on_registration(self, manager):
+        manager.add_webhook("generic", "http://example.invalid/a", headers={"X-Key": "k"})
+        manager.add_webhook("slack", "http://example.invalid/b")
+        assert manager._webhooks[0]["request_headers"] == {
+            "Content-Type": "application/json",
+            "X-Key": "k",
+        }
+        assert manager._webhooks[1]["request_headers"] == {"Content-Type": "application/json"}
+
+
+# =============================================================================
+# Retry Tests
+# =============================================================================
+
+class TestRetry:
+    """Tests for webhook delivery retries."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        import alerting
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(alerting.asyncio, "sleep", fake_sleep)
+        return sleeps
+
+    def _responses(self, *codes, headers=None):
+        return [MagicMock(status_code=c, text="", headers=headers or {}) for c in codes]
+
+    @pytest.mark.asyncio
+    async def test_retries_server_error(self, manager, sample_alert, no_sleep):
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        client = _install_client(manager, _mock_client())
+        client.post = AsyncMock(side_effect=self._responses(503, 200))
+
+        assert await manager._send_one(manager._webhooks[0], sample_alert) is True
+        assert client.post.await_count == 2
+        assert len(no_sleep) == 1
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, manager, sample_alert, no_sleep):
+        manager.add_webhook("discord", "http://example.invalid/hook")
+        client = _install_client(manager, _mock_client())
+        client.post = AsyncMock(side_effect=self._responses(429, 204, headers={"Retry-After": "5"}))
+
+        assert await manager._send_one(manager._webhooks[0], sample_alert) is True
+        assert 5 <= no_sleep[0] < 5.5
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, manager, sample_alert, no_sleep):
+        import alerting
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        client = _install_client(manager, _mock_client(status_code=500))
+
+        assert await manager._send_one(manager._webhooks[0], sample_alert) is False
+        assert client.post.await_count == alerting.WEBHOOK_MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self, manager, sample_alert, no_sleep):
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        client = _install_client(manager, _mock_client(status_code=400))
+
+        assert await manager._send_one(manager._webhooks[0], sample_alert) is False
+        assert client.post.await_count == 1
+        assert no_sleep == []
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_error(self, manager, sample_alert, no_sleep):
+        import httpx
+        manager.add_webhook("generic", "http://example.invalid/hook")
+        client = _install_client(manager, _mock_client())
+        client.post = AsyncMock(side_effect=[httpx.ConnectError("refused"), *self._responses(200)])
+
+        assert await manager._send_one(manager._webhooks[0], sample_alert) is True
+        assert client.post.await_count == 2
+
@@ -24,6 +24,8 @@ import pytest
 # Skip all tests in this module if DATABASE_URL points to unreachable host
 # These tests require TestClient which triggers app startup
 pytestmark = pytest.mark.api
+import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from fastapi.testclient import TestClient
@@ -37,6 +39,12 @@ from api import app, parse_time_range, get_kit_status
 class TestHealthEndpoint:
     """Tests for GET /health endpoint."""
 
+    @pytest.fixture(autouse=True)
+    def reset_health_state(self):
+        """Start each test without a cached probe result."""
+        with patch.dict("api.HEALTH_STATE", {"ok": False, "ts": 0.0, "error": None}):
+            yield
+
     def test_health_check_success(self, client_with_mocked_db, mock_asyncpg_connection):
         """
         Test successful health check when database is available.
@@ -83,10 +91,32 @@ class TestHealthEndpoint:
         assert response.status_code == 503
         assert "Database connection failed" in response.json()["detail"]
 
+    def test_health_check_uses_cached_probe(self, client_with_mocked_db, mock_asyncpg_connection):
+        """
+        Test health check served from a fresh background probe result.
+
+        Verifies that:
+        - Returns 200 without querying the database
+        """
+        import time
+        with patch.dict("api.HEALTH_STATE", {"ok": True, "ts": time.monotonic(), "error": None}):
+            response = client_with_mocked_db.get("/health")
+
+        assert response.status_code == 200
+        mock_asyncpg_connection.fetchval.assert_not_called()
+
 
 class TestKitsEndpoint:
     """Tests for GET /api/kits endpoint."""
 
+    @pytest.fixture(autouse=True)
+    def reset_kits_cache(self):
+        """Each test sees its own mocked rows, not a cached listing."""
+        from api import _invalidate_kits_cache
+        _invalidate_kits_cache()
+        yield
+        _invalidate_kits_cache()
+
     def test_list_all_kits(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_kits, mock_asyncpg_row):
         """
         Test listing all kits without filters.
@@ -526,6 +556,19 @@ class TestSignalsEndpoint:
         assert response.status_code == 500
 
 
+def _mock_copy_rows(conn, rows):
+    """Make conn.copy_from_query write rows as CSV (with header) like COPY ... CSV HEADER."""
+    async def copy_from_query(query, *args, output, **kwargs):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0].keys()) if rows else ["time"])
+        writer.writeheader()
+        writer.writerows(rows)
+        await output(buffer.getvalue().encode())
+        return f"COPY {len(rows)}"
+
+    conn.copy_from_query.side_effect = copy_from_query
+
+
 class TestExportCSVEndpoint:
     """Tests for GET /api/export/csv endpoint."""
 
@@ -539,8 +582,7 @@ class TestExportCSVEndpoint:
         - CSV contains header row
         - CSV data is properly formatted
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        _mock_copy_rows(mock_asyncpg_connection, api_sample_drones)
 
         response = client_with_mocked_db.get("/api/export/csv")
 
@@ -564,8 +606,7 @@ class TestExportCSVEndpoint:
         - Only filtered data is included
         """
         dji_drones = [d for d in api_sample_drones if d.get("rid_make") == "DJI"]
-        mock_rows = [mock_asyncpg_row(drone) for drone in dji_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        _mock_copy_rows(mock_asyncpg_connection, dji_drones)
 
         response = client_with_mocked_db.get("/api/export/csv?rid_make=DJI")
 
@@ -580,7 +621,7 @@ class TestExportCSVEndpoint:
         - Returns 200 status even with no data
         - Returns empty or header-only CSV
         """
-        mock_asyncpg_connection.fetch.return_value = []
+        _mock_copy_rows(mock_asyncpg_connection, [])
 
         response = client_with_mocked_db.get("/api/export/csv")
 
@@ -596,8 +637,7 @@ class TestExportCSVEndpoint:
         - Custom time range is applied to export
         - Data is filtered by time range
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        _mock_copy_rows(mock_asyncpg_connection, api_sample_drones)
 
         start = "2026-01-20T10:00:00"
         end = "2026-01-20T12:00:00"
@@ -626,7 +666,7 @@ class TestExportCSVEndpoint:
         - Returns 500 status on error
         - Error is properly handled
         """
-        mock_asyncpg_connection.fetch.side_effect = Exception("Export failed")
+        mock_asyncpg_connection.copy_from_query.side_effect = Exception("Export failed")
 
         response = client_with_mocked_db.get("/api/export/csv")
 
@@ -818,6 +858,25 @@ class TestDatabaseQueryConstruction:
         assert "AND time <=" in query
         assert "LIMIT" in query
 
+    def test_filter_queries_are_cached_per_combination(self):
+        """
+        Test the cached filter query builders.
+
+        Verifies that:
+        - Placeholders are numbered densely for the filters present
+        - The same filter combination returns the same query text object
+        """
+        from api import _drone_queries, _signals_query
+
+        query, count_query = _drone_queries((False, True, False, True), False)
+        assert "rid_make = $3" in query
+        assert "transport = $4" in query
+        assert "LIMIT $5" in query
+        assert "kit_id = ANY" not in count_query
+        assert _drone_queries((False, True, False, True), False)[0] is query
+
+        assert "detection_type = $3" in _signals_query((False, True))
+
     def test_signals_query_construction(self, client_with_mocked_db, mock_asyncpg_connection):
         """
         Test that signals query is constructed correctly.
@@ -918,6 +977,272 @@ class TestGetKitStatusHelper:
                 await get_kit_status()
 
 
+class TestKitsCache:
+    """Tests for the /api/kits listing cache."""
+
+    @pytest.fixture(autouse=True)
+    def reset_kits_cache(self):
+        from api import _invalidate_kits_cache
+        _invalidate_kits_cache()
+        yield
+        _invalidate_kits_cache()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_query(self):
+        """
+        Test cache single-flight.
+
+        Verifies that:
+        - Concurrent callers wait for one get_kit_status() call
+        - Later callers within the TTL reuse the result
+        """
+        import asyncio
+        from api import _cached_kit_status
+
+        async def slow_status():
+            await asyncio.sleep(0.01)
+            return [{"kit_id": "kit001"}]
+
+        with patch("api.get_kit_status", side_effect=slow_status) as mock_status:
+            results = await asyncio.gather(*[_cached_kit_status() for _ in range(5)])
+            await _cached_kit_status()
+
+        assert mock_status.call_count == 1
+        assert all(r == [{"kit_id": "kit001"}] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refresh(self):
+        """
+        Test cache invalidation.
+
+        Verifies that:
+        - Invalidating (as the admin endpoints do) makes the next call query again
+        """
+        from api import _cached_kit_status, _invalidate_kits_cache
+
+        with patch("api.get_kit_status", AsyncMock(return_value=[])) as mock_status:
+            await _cached_kit_status()
+            _invalidate_kits_cache()
+            await _cached_kit_status()
+
+        assert mock_status.call_count == 2
+
+
+class TestApiUrlHelpers:
+    """Tests for kit API URL normalization and validation."""
+
+    def test_normalize_and_validate(self):
+        """
+        Test kit API URL helpers.
+
+        Verifies that:
+        - Bare host:port gets an http:// scheme and trailing slashes are stripped
+        - Normalized URLs with a host are accepted
+        - URLs without a usable host are rejected
+        """
+        from api import _normalize_api_url, _valid_api_url
+
+        assert _normalize_api_url("192.168.1.10:8088/") == "http://192.168.1.10:8088"
+        assert _normalize_api_url("https://kit.local") == "https://kit.local"
+        assert _valid_api_url("http://192.168.1.10:8088")
+        assert _valid_api_url("https://kit.local/api")
+        assert not _valid_api_url(_normalize_api_url("http://"))
+        assert not _valid_api_url("http://kit local:8088")
+        assert not _valid_api_url("ftp://kit.local")
+
+
+class TestKitConnectionHelper:
+    """Tests for _test_kit_connection() helper function."""
+
+    @pytest.mark.asyncio
+    async def test_probes_share_one_client(self):
+        """
+        Test kit connection probes.
+
+        Verifies that:
+        - The kit_id is read from the kit's /status response
+        - Repeated probes go through the same shared client
+        """
+        import httpx
+        import api
+
+        requests = []
+
+        def handler(request):
+            requests.append(str(request.url))
+            return httpx.Response(200, json={"kit_id": "kit-alpha"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("api._kit_http", client), patch("api._probe_cache", OrderedDict()):
+            first = await api._test_kit_connection("http://10.0.0.1:8088/")
+            second = await api._test_kit_connection("http://10.0.0.2:8088")
+            assert api._get_kit_http() is client
+        await client.aclose()
+
+        assert first.success and first.kit_id == "kit-alpha"
+        assert second.success
+        assert requests == ["http://10.0.0.1:8088/status", "http://10.0.0.2:8088/status"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_probes_are_cached(self):
+        """
+        Test the kit probe cache.
+
+        Verifies that:
+        - Concurrent probes of one URL share a single request
+        - A fresh result is reused until the TTL expires
+        """
+        import httpx
+        import api
+
+        requests = []
+
+        async def handler(request):
+            requests.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"kit_id": "kit-alpha"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("api._kit_http", client), patch("api._probe_cache", OrderedDict()):
+            results = await asyncio.gather(
+                *[api._test_kit_connection("http://10.0.0.1:8088") for _ in range(5)]
+            )
+            await api._test_kit_connection("http://10.0.0.1:8088/")
+            assert len(requests) == 1
+            with patch("api.KIT_PROBE_CACHE_TTL_SECONDS", 0):
+                await api._test_kit_connection("http://10.0.0.1:8088")
+        await client.aclose()
+
+        assert all(r.kit_id == "kit-alpha" for r in results)
+        assert len(requests) == 2
+
+
+class TestEnsureEnabledColumn:
+    """Tests for _ensure_enabled_column() helper function."""
+
+    @pytest.mark.asyncio
+    async def test_checks_schema_once(self, mock_asyncpg_pool, mock_asyncpg_connection):
+        """
+        Test the kits.enabled column check.
+
+        Verifies that:
+        - The first call checks the catalog
+        - Later calls return without a database round trip
+        """
+        from api import _ensure_enabled_column
+
+        mock_asyncpg_connection.fetchval.return_value = True
+
+        with patch("api.db_pool", mock_asyncpg_pool), patch("api._enabled_column_ready", False):
+            await _ensure_enabled_column()
+            await _ensure_enabled_column()
+
+        assert mock_asyncpg_connection.fetchval.await_count == 1
+        mock_asyncpg_connection.execute.assert_not_called()
+
+
+class TestBulkInsertKitsHelper:
+    """Tests for _bulk_insert_kits() helper function."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_uses_single_copy(self, mock_asyncpg_pool, mock_asyncpg_connection):
+        """
+        Test bulk kit insert.
+
+        Verifies that:
+        - All kits are written with one copy_records_to_table call
+        - Records follow the declared column order
+        """
+        from api import _bulk_insert_kits, _KIT_BULK_COLUMNS
+
+        rows = [
+            {"kit_id": "kit-a", "name": "A", "api_url": "http://a:8088", "location": None, "status": "online", "enabled": True},
+            {"kit_id": "kit-b", "name": "B", "api_url": "http://b:8088", "location": "HQ", "status": "offline", "enabled": False},
+        ]
+
+        with patch("api.db_pool", mock_asyncpg_pool):
+            inserted = await _bulk_insert_kits(rows)
+
+        assert inserted == 2
+        mock_asyncpg_connection.copy_records_to_table.assert_awaited_once()
+        kwargs = mock_asyncpg_connection.copy_records_to_table.call_args.kwargs
+        assert kwargs["columns"] == list(_KIT_BULK_COLUMNS)
+        assert kwargs["records"][1] == ("kit-b", "B", "http://b:8088", "HQ", "offline", False)
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_empty(self, mock_asyncpg_pool, mock_asyncpg_connection):
+        """
+        Test bulk kit insert with nothing to insert.
+
+        Verifies that:
+        - No database call is made
+        """
+        from api import _bulk_insert_kits
+
+        with patch("api.db_pool", mock_asyncpg_pool):
+            assert await _bulk_insert_kits([]) == 0
+
+        mock_asyncpg_connection.copy_records_to_table.assert_not_called()
+
+
+class TestNDJSONStreaming:
+    """Tests for _ndjson_response() helper function."""
+
+    @pytest.mark.asyncio
+    async def test_streams_rows_from_cursor(self, mock_asyncpg_pool, mock_asyncpg_connection):
+        """
+        Test NDJSON streaming of query rows.
+
+        Verifies that:
+        - Rows come from a server-side cursor with the query params
+        - Each row is written as one JSON line
+        - The idle-in-transaction timeout is lifted for the stream
+        """
+        import json
+        from api import _ndjson_response, NDJSON_MEDIA_TYPE
+
+        rows = [{"drone_id": "drone-1", "rssi": -60}, {"drone_id": "drone-2", "rssi": -72}]
+
+        async def cursor_rows():
+            for row in rows:
+                yield row
+
+        mock_asyncpg_connection.cursor = MagicMock(return_value=cursor_rows())
+
+        with patch("api.db_pool", mock_asyncpg_pool):
+            response = await _ndjson_response("SELECT 1", ["a", 2])
+            body = b"".join([chunk async for chunk in response.body_iterator])
+
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        assert mock_asyncpg_connection.cursor.call_args.args == ("SELECT 1", "a", 2)
+        assert [json.loads(line) for line in body.splitlines()] == rows
+        mock_asyncpg_connection.execute.assert_awaited_with(
+            "SET LOCAL idle_in_transaction_session_timeout = 0"
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_result(self, mock_asyncpg_pool, mock_asyncpg_connection):
+        """
+        Test NDJSON streaming with no matching rows.
+
+        Verifies that:
+        - The response body is empty
+        """
+        from api import _ndjson_response
+
+        async def cursor_rows():
+            return
+            yield
+
+        mock_asyncpg_connection.cursor = MagicMock(return_value=cursor_rows())
+
+        with patch("api.db_pool", mock_asyncpg_pool):
+            response = await _ndjson_response("SELECT 1", [])
+            body = b"".join([chunk async for chunk in response.body_iterator])
+
+        assert body == b""
+
+
 class TestErrorHandling:
     """Tests for general error handling."""
 
@@ -27,6 +27,15 @@ import json
 from api import app
 
 
+@pytest.fixture(autouse=True)
+def reset_pattern_cache():
+    """Each test sees its own mocked rows, not a cached pattern result."""
+    from api import _clear_pattern_cache
+    _clear_pattern_cache()
+    yield
+    _clear_pattern_cache()
+
+
 class TestRepeatedDronesEndpoint:
     """Tests for GET /api/patterns/repeated-drones endpoint."""
 
@@ -287,11 +296,10 @@ class TestPilotReuseEndpoint:
             }
         ]
 
-        operator_rows = [mock_asyncpg_row(item) for item in operator_data]
-        proximity_rows = [mock_asyncpg_row(item) for item in proximity_data]
-
-        # Mock fetch to return different results for each query
-        mock_asyncpg_connection.fetch.side_effect = [operator_rows, proximity_rows]
+        # Both methods come back from a single query, operator_id matches first
+        mock_asyncpg_connection.fetch.return_value = [
+            mock_asyncpg_row(item) for item in operator_data + proximity_data
+        ]
 
         response = client_with_mocked_db.get("/api/patterns/pilot-reuse")
 
@@ -301,6 +309,8 @@ class TestPilotReuseEndpoint:
         assert data["count"] == 2
         assert data["time_window_hours"] == 24
         assert data["proximity_threshold_m"] == 50
+        assert data["limit"] == 100
+        assert data["offset"] == 0
 
     def test_pilot_reuse_custom_params(self, client_with_mocked_db, mock_asyncpg_connection):
         """
@@ -311,12 +321,17 @@ class TestPilotReuseEndpoint:
         """
         mock_asyncpg_connection.fetch.side_effect = [[], []]
 
-        response = client_with_mocked_db.get("/api/patterns/pilot-reuse?time_window_hours=48&proximity_threshold_m=100")
+        response = client_with_mocked_db.get(
+            "/api/patterns/pilot-reuse?time_window_hours=48&proximity_threshold_m=100&limit=20&offset=40"
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["time_window_hours"] == 48
         assert data["proximity_threshold_m"] == 100
+        assert data["limit"] == 20
+        assert data["offset"] == 40
+        assert mock_asyncpg_connection.fetch.call_args[0][1:] == (48, 100, 20, 40)
 
     def test_pilot_reuse_operator_id_only(self, client_with_mocked_db, mock_asyncpg_connection, mock_asyncpg_row):
         """
@@ -359,7 +374,7 @@ class TestPilotReuseEndpoint:
             }
         ]
         proximity_rows = [mock_asyncpg_row(item) for item in proximity_data]
-        mock_asyncpg_connection.fetch.side_effect = [[], proximity_rows]
+        mock_asyncpg_connection.fetch.return_value = proximity_rows
 
         response = client_with_mocked_db.get("/api/patterns/pilot-reuse")
 
@@ -465,6 +480,23 @@ class TestAnomaliesEndpoint:
         data = response.json()
         assert data["time_window_hours"] == 12
 
+    def test_anomalies_cached_per_window(self, client_with_mocked_db, mock_asyncpg_connection):
+        """
+        Test anomaly result caching.
+
+        Verifies that:
+        - A repeated request for the same window reuses the cached rows
+        - A different window runs its own query
+        """
+        mock_asyncpg_connection.fetch.return_value = []
+
+        client_with_mocked_db.get("/api/patterns/anomalies?time_window_hours=6")
+        client_with_mocked_db.get("/api/patterns/anomalies?time_window_hours=6")
+        assert mock_asyncpg_connection.fetch.await_count == 1
+
+        client_with_mocked_db.get("/api/patterns/anomalies?time_window_hours=7")
+        assert mock_asyncpg_connection.fetch.await_count == 2
+
     def test_anomalies_speed_only(self, client_with_mocked_db, mock_asyncpg_connection, mock_asyncpg_row):
         """
         Test anomaly detection with only speed anomalies.
@@ -863,22 +895,16 @@ class TestSignalLocationEstimation:
 
         # Mock kit positions
         kit_positions = [
-            {"lat": 37.7740, "lon": -122.4180, "alt": 10.0, "time": datetime.now(timezone.utc)},
-            {"lat": 37.7760, "lon": -122.4210, "alt": 12.0, "time": datetime.now(timezone.utc)}
+            {"kit_id": "kit-alpha", "lat": 37.7740, "lon": -122.4180, "alt": 10.0},
+            {"kit_id": "kit-bravo", "lat": 37.7760, "lon": -122.4210, "alt": 12.0}
         ]
 
-        call_count = [0]
-
-        def mock_fetch(*args, **kwargs):
+        def mock_fetch(query, *args, **kwargs):
+            if "system_health" in query:
+                return [mock_asyncpg_row(p) for p in kit_positions]
             return [mock_asyncpg_row(d) for d in signal_data]
 
-        def mock_fetchrow(*args, **kwargs):
-            pos = kit_positions[call_count[0] % len(kit_positions)]
-            call_count[0] += 1
-            return mock_asyncpg_row(pos)
-
         mock_asyncpg_connection.fetch.side_effect = mock_fetch
-        mock_asyncpg_connection.fetchrow.side_effect = mock_fetchrow
 
         response = client_with_mocked_db.get(
             "/api/analysis/estimate-signal-location?freq_mhz=5800.0"
@@ -965,22 +991,16 @@ class TestSignalLocationEstimation:
         ]
 
         kit_positions = [
-            {"lat": 37.7740 + i*0.001, "lon": -122.4180 - i*0.001, "alt": 10.0, "time": datetime.now(timezone.utc)}
+            {"kit_id": f"kit-{i}", "lat": 37.7740 + i*0.001, "lon": -122.4180 - i*0.001, "alt": 10.0}
             for i in range(3)
         ]
 
-        call_count = [0]
-
-        def mock_fetch(*args, **kwargs):
+        def mock_fetch(query, *args, **kwargs):
+            if "system_health" in query:
+                return [mock_asyncpg_row(p) for p in kit_positions]
             return [mock_asyncpg_row(d) for d in signal_data]
 
-        def mock_fetchrow(*args, **kwargs):
-            pos = kit_positions[call_count[0] % len(kit_positions)]
-            call_count[0] += 1
-            return mock_asyncpg_row(pos)
-
         mock_asyncpg_connection.fetch.side_effect = mock_fetch
-        mock_asyncpg_connection.fetchrow.side_effect = mock_fetchrow
 
         response = client_with_mocked_db.get(
             "/api/analysis/estimate-signal-location?freq_mhz=5800.0"
@@ -991,6 +1011,44 @@ class TestSignalLocationEstimation:
         assert data["kit_count"] == 3
         assert data["triangulation_possible"] is True
 
+    def test_estimate_signal_location_reuses_kit_positions(self, client_with_mocked_db, mock_asyncpg_connection, mock_asyncpg_row):
+        """
+        Test that kit positions are looked up once for repeated estimates.
+
+        Verifies that:
+        - All kit positions come from a single query
+        - A repeat estimate for the same time does not query them again
+        - A kit without a GPS fix is not cached and is looked up again
+        """
+        now = datetime.now(timezone.utc)
+        signal_data = [
+            {"kit_id": f"kit-{i}", "power_dbm": -45.0 - i*5, "freq_mhz": 5800.0,
+             "time": now, "signal_lat": None, "signal_lon": None,
+             "pal_conf": 0.8, "ntsc_conf": 0.1}
+            for i in range(4)
+        ]
+        kit_positions = [
+            {"kit_id": f"kit-{i}", "lat": 37.7740 + i*0.001, "lon": -122.4180 - i*0.001, "alt": 10.0}
+            for i in range(3)
+        ]
+        position_queries = []
+
+        def mock_fetch(query, *args, **kwargs):
+            if "system_health" in query:
+                position_queries.append(args[0])
+                return [mock_asyncpg_row(p) for p in kit_positions]
+            return [mock_asyncpg_row(d) for d in signal_data]
+
+        mock_asyncpg_connection.fetch.side_effect = mock_fetch
+
+        url = f"/api/analysis/estimate-signal-location?freq_mhz=5800.0&timestamp={now.isoformat().replace('+00:00', 'Z')}"
+        assert client_with_mocked_db.get(url).status_code == 200
+        assert client_with_mocked_db.get(url).status_code == 200
+
+        assert len(position_queries) == 2
+        assert sorted(position_queries[0]) == ["kit-0", "kit-1", "kit-2", "kit-3"]
+        assert position_queries[1] == ["kit-3"]
+
     def test_estimate_signal_location_database_error(self, client_with_mocked_db, mock_asyncpg_connection):
         """
         Test error handling when database query fails.
@@ -1005,3 +1063,43 @@ class TestSignalLocationEstimation:
         )
 
         assert response.status_code == 500
+
+
+class TestTrilateration:
+    """Tests for the 3+ kit trilateration solver."""
+
+    @pytest.mark.parametrize("num_kits", [3, 6, 10, 12])
+    def test_trilateration_recovers_known_position(self, num_kits):
+        """
+        Test trilateration against a known drone position.
+
+        Verifies that:
+        - The estimate lands within 25m of the true position when RSSI
+          matches the path loss model exactly
+        - The solver stays stable as the number of kits grows
+        """
+        import math
+        import random
+        from api import _trilaterate_3plus_kits, calculate_distance_meters
+
+        rng = random.Random(num_kits)
+        drone_lat, drone_lon = 37.7749, -122.4194
+        observations = []
+        for i in range(num_kits):
+            kit_lat = drone_lat + rng.uniform(-0.015, 0.015)
+            kit_lon = drone_lon + rng.uniform(-0.015, 0.015)
+            dist = calculate_distance_meters(drone_lat, drone_lon, kit_lat, kit_lon)
+            observations.append({
+                "kit_id": f"kit-{i}",
+                "kit_lat": kit_lat,
+                "kit_lon": kit_lon,
+                # Inverse of rssi_to_distance_meters' default model
+                "rssi": -25 * math.log10(dist),
+            })
+
+        result = _trilaterate_3plus_kits(observations)
+
+        assert result["method"] == "trilateration"
+        assert len(result["estimated_distances"]) == num_kits
+        error = calculate_distance_meters(drone_lat, drone_lon, result["lat"], result["lon"])
+        assert error < 25
@@ -140,6 +140,8 @@ SELECT create_hypertable('drones', 'time');
 -- =============================================================================
 
 -- Index for querying specific drones across time
+-- Also matches the DISTINCT ON (drone_id) ... ORDER BY drone_id, time DESC
+-- dedup in /api/drones and the per-drone track lookup, so neither needs a sort
 CREATE INDEX idx_drones_drone_id ON drones(drone_id, time DESC);
 
 -- Index for querying all drones from a specific kit
@@ -775,6 +775,15 @@ CREATE INDEX IF NOT EXISTS idx_drones_speed_anomaly ON drones(speed, time DESC)
 CREATE INDEX IF NOT EXISTS idx_drones_altitude_anomaly ON drones(alt, time DESC)
     WHERE alt > 400;
 
+-- Time-ordered partial indexes matching the /api/patterns/anomalies branches
+-- (time window, track_type = 'drone', threshold, newest first), so each branch
+-- reads only the anomalous rows in the window, already in output order
+CREATE INDEX IF NOT EXISTS idx_drones_speed_anomaly_time ON drones(time DESC)
+    WHERE speed > 30 AND track_type = 'drone';
+
+CREATE INDEX IF NOT EXISTS idx_drones_altitude_anomaly_time ON drones(time DESC)
+    WHERE alt > 400 AND track_type = 'drone';
+
 -- Index for track_type drone filtering (used by most pattern detection queries)
 CREATE INDEX IF NOT EXISTS idx_drones_track_type_drone ON drones(time DESC)
     WHERE track_type = 'drone' AND lat IS NOT NULL AND lon IS NOT NULL;
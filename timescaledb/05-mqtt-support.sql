@@ -16,6 +16,9 @@
 ALTER TABLE kits ADD COLUMN IF NOT EXISTS source TEXT DEFAULT 'http'
     CHECK (source IN ('http', 'mqtt', 'both'));
 
+-- ADD COLUMN IF NOT EXISTS leaves an existing column alone, so set the default explicitly
+ALTER TABLE kits ALTER COLUMN source SET DEFAULT 'http';
+
 -- Make api_url nullable (MQTT-only kits don't have an HTTP API URL)
 -- Note: We can't directly change NOT NULL to nullable, so we recreate the constraint
 ALTER TABLE kits ALTER COLUMN api_url DROP NOT NULL;